@@ -0,0 +1,163 @@
+# -*- mode: python ; coding: utf-8 -*-
+# TidyCore.spec
+# PyInstaller build specification for TidyCore. Built by scripts/build_release.py,
+# which runs PyInstaller on this spec (with --noconfirm) from the project root.
+import json
+import os
+import pkgutil
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
+
+from PyInstaller.utils.hooks import collect_all, copy_metadata
+
+ROOT = SPECPATH  # Directory containing this spec (the project root)
+
+# Modules pulled in transitively (or present in the build venv) that the app
+# never imports. numpy is only in requirements.txt as a build-env leftover.
+EXCLUDED_MODULES = [
+    'tkinter',
+    'unittest',
+    'pydoc',
+    'test',
+    'distutils',
+    'setuptools',
+    'pip',
+    'numpy',
+]
+
+# Qt modules the GUI never imports (it only uses QtCore, QtGui and QtWidgets).
+# Every byte in the onefile payload is unpacked on each launch, so keep these
+# from being dragged in through PySide6_Addons or qtpy's optional imports.
+EXCLUDED_MODULES += [
+    'PySide6.QtNetwork',
+    'PySide6.QtQml',
+    'PySide6.QtQuick',
+    'PySide6.QtQuickWidgets',
+    'PySide6.QtQuick3D',
+    'PySide6.QtWebEngineCore',
+    'PySide6.QtWebEngineWidgets',
+    'PySide6.QtWebChannel',
+    'PySide6.QtMultimedia',
+    'PySide6.QtPdf',
+    'PySide6.Qt3DCore',
+]
+
+datas = [
+    (os.path.join(ROOT, 'icon.png'), '.'),        # Include icon file
+    (os.path.join(ROOT, 'config'), 'config'),     # Include config directory
+]
+binaries = []
+
+# Packages that load their submodules or data dynamically at runtime (codec
+# lookup, the requests/urllib3 networking stack, certifi's CA bundle), so
+# static analysis of the app's imports can't see everything they need.
+DYNAMIC_PACKAGES = (
+    'encodings',
+    'idna',
+    'certifi',
+    'requests',
+    'urllib3',
+    'charset_normalizer',
+)
+
+# Everything else (PySide6, qtawesome, watchdog, packaging and the stdlib) is
+# found by PyInstaller from the app's own import statements.
+hiddenimports = [
+    'unicodedata',          # Fix for requests/idna module (imported lazily)
+]
+
+# Bundle every module of the app package without hand-maintaining the list,
+# named the way main.py imports them
+hiddenimports += [
+    name for _, name, _ in
+    pkgutil.walk_packages([os.path.join(ROOT, 'src', 'tidycore')], prefix='src.tidycore.')
+]
+
+# collect_all walks each package on disk, so its results are cached in the
+# PyInstaller work path (wiped by --clean) and keyed by interpreter and
+# package version; reinstalling or upgrading a package invalidates its entry.
+COLLECT_CACHE_FILE = os.path.join(workpath, 'collect-cache.json')
+INTERPRETER_KEY = f'{sys.executable} {sys.version}'
+
+
+def package_version(package):
+    """Installed distribution version of package, or the Python version for stdlib."""
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return sys.version
+
+
+try:
+    with open(COLLECT_CACHE_FILE, encoding='utf-8') as f:
+        collect_cache = json.load(f)
+    if collect_cache.get('interpreter') != INTERPRETER_KEY:
+        collect_cache = {}
+except (OSError, ValueError):
+    collect_cache = {}
+cached_packages = collect_cache.get('packages', {})
+
+# Collect submodules, data files (SSL certificates are CRITICAL for HTTPS) and
+# binaries of each dynamic package, skipping anything not installed
+for package in DYNAMIC_PACKAGES:
+    if find_spec(package) is None:
+        continue
+    key = f'{package}=={package_version(package)}'
+    if key not in cached_packages:
+        cached_packages[key] = collect_all(package)
+    package_datas, package_binaries, package_hiddenimports = cached_packages[key]
+    datas += [tuple(entry) for entry in package_datas]
+    binaries += [tuple(entry) for entry in package_binaries]
+    hiddenimports += package_hiddenimports
+
+os.makedirs(workpath, exist_ok=True)
+with open(COLLECT_CACHE_FILE, 'w', encoding='utf-8') as f:
+    json.dump({'interpreter': INTERPRETER_KEY, 'packages': cached_packages}, f)
+
+# Copy package metadata to fix Unicode and SSL issues
+for distribution in ('certifi', 'requests', 'urllib3', 'idna', 'charset-normalizer'):
+    datas += copy_metadata(distribution)
+
+hiddenimports = list(dict.fromkeys(hiddenimports))
+
+
+a = Analysis(
+    [os.path.join(ROOT, 'main.py')],
+    pathex=[os.path.join(ROOT, 'src')],             # Add src to Python path
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],       # idna/unicodedata collection is done above, not in hooks
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDED_MODULES,
+    noarchive=False,
+    # Strip asserts and docstrings from bundled bytecode (python -OO). Drop to 1
+    # if a dependency ever needs its docstrings at runtime.
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+# Single file executable (the updater swaps this one file)
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='TidyCore',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,          # Skip UPX: faster builds and no decompression at launch
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,      # No console window
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=[os.path.join(ROOT, 'icon.png')],
+)
@@ -1,15 +1,14 @@
 # main.py
+import os
 import sys
+import atexit
 import threading
-import time
-from typing import Final
+from typing import Final, TYPE_CHECKING
 
-from PySide6.QtWidgets import QApplication
-from src.tidycore.gui import TidyCoreGUI
-from src.tidycore.logger import setup_logger
-from src.tidycore.engine import TidyCoreEngine
-from src.tidycore.config_manager import load_config
-from src.tidycore.signals import signals
+# PySide6 and the app modules are imported inside the functions that need
+# them, so importing this module (e.g. from tooling) stays cheap.
+if TYPE_CHECKING:
+    from src.tidycore.engine import TidyCoreEngine
 
 # ────────────────────────────────────────────────────────────
 # Define application exit codes for clear error handling in CI/CD and shell scripts.
@@ -24,11 +23,21 @@ class ConfigError(Exception):
 
 
 # ────────────────────────────────────────────────────────────
+# How long a restart waits for the old engine thread to shut down
+ENGINE_STOP_TIMEOUT_SECONDS: Final[float] = 5.0
+
+# Written next to the frozen executable so the release build script can stop
+# a running instance without scanning every process
+PID_FILE_NAME: Final[str] = "TidyCore.pid"
+
 # Global variable to hold the engine instance
-current_engine: Final[TidyCoreEngine | None] = None
+current_engine: Final["TidyCoreEngine | None"] = None
 
-def start_engine_thread(logger) -> TidyCoreEngine:
+def start_engine_thread(logger) -> "TidyCoreEngine":
     """Initializes and runs the TidyCoreEngine, returning the instance."""
+    from src.tidycore.engine import TidyCoreEngine
+    from src.tidycore.config_manager import load_config
+
     global current_engine
     try:
         config = load_config()
@@ -50,6 +59,10 @@ def start_engine_thread(logger) -> TidyCoreEngine:
 
 def run_gui_application(logger, engine) -> int:
     """Initializes and runs the main GUI application."""
+    from PySide6.QtWidgets import QApplication
+    from src.tidycore.gui import TidyCoreGUI
+    from src.tidycore.signals import signals
+
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     window = TidyCoreGUI(engine, app)
@@ -60,13 +73,23 @@ def run_gui_application(logger, engine) -> int:
 
 def restart_engine_flow(logger):
     """Stops the current engine and starts a new one."""
+    from PySide6.QtWidgets import QApplication
+    from src.tidycore.gui import TidyCoreGUI
+    from src.tidycore.signals import signals
+
     logger.info("Restarting engine due to configuration change...")
     
     global current_engine
     if current_engine:
         current_engine.stop()
+        # Wait for the actual shutdown rather than a fixed delay
+        if not current_engine.wait_until_stopped(ENGINE_STOP_TIMEOUT_SECONDS):
+            logger.warning("Previous engine did not stop within %.0f seconds.", ENGINE_STOP_TIMEOUT_SECONDS)
     
-    time.sleep(1) 
+    # The new engine starts counting from the database, so the old engine's
+    # last batch must be written first
+    from src.tidycore.database import statistics_db
+    statistics_db.flush()
     
     try:
         new_engine = start_engine_thread(logger)
@@ -84,10 +107,35 @@ def restart_engine_flow(logger):
         signals.log_message.emit(f"[ERROR] An unexpected error occurred during restart: {e}")
 
 
+def write_pid_file(logger) -> None:
+    """Records this process's PID next to the executable, removing it on exit."""
+    if not getattr(sys, "frozen", False):
+        return
+    pid_file = os.path.join(os.path.dirname(sys.executable), PID_FILE_NAME)
+    try:
+        with open(pid_file, "w") as f:
+            f.write(str(os.getpid()))
+    except OSError as exc:
+        # e.g. installed to a read-only location; the PID file is only a convenience
+        logger.debug("Could not write PID file: %s", exc)
+        return
+
+    def remove_pid_file():
+        try:
+            os.remove(pid_file)
+        except OSError:
+            pass
+    atexit.register(remove_pid_file)
+
+
 def main() -> int:
     """The main entry point for the TidyCore application."""
+    from src.tidycore.logger import setup_logger
+    from src.tidycore.signals import signals
+
     logger = setup_logger()
     logger.info("TidyCore application starting...")
+    write_pid_file(logger)
 
     try:
         engine = start_engine_thread(logger)
@@ -107,6 +155,10 @@ def main() -> int:
 
     if current_engine:
         current_engine.stop()
+        current_engine.wait_until_stopped(ENGINE_STOP_TIMEOUT_SECONDS)
+
+    from src.tidycore.database import statistics_db
+    statistics_db.close()
     logger.info("Application shutting down gracefully.")
     return gui_exit_code
 
@@ -4,9 +4,18 @@ Script to build TidyCore release executable using PyInstaller.
 """
 import os
 import sys
+import argparse
+import hashlib
+import re
+import select
 import shutil
+import signal
+import stat
 import subprocess
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
 try:
@@ -14,39 +23,183 @@ try:
 except ImportError:
     psutil = None
 
+# PyInstaller keeps its module-graph and bytecode caches in the work path and
+# its per-user cache in the config dir; both must be stable for incremental
+# rebuilds to reuse them.
+BUILD_WORK_PATH = 'build'
+SPEC_FILE = 'TidyCore.spec'
+PYINSTALLER_CONFIG_DIR = Path.home() / '.tidycore-build' / 'pyinstaller'
+
+# Everything that affects the executable; if none of it changed since the last
+# successful build, PyInstaller does not need to run at all.
+BUILD_INPUTS = [
+    'main.py',
+    SPEC_FILE,
+    'src/tidycore',
+    'config',
+    'icon.png',
+    'requirements.txt',
+    'scripts',
+]
+BUILD_KEY_FILE = Path(BUILD_WORK_PATH) / '.tidycore-cache-key'
+# Spec changes alter the whole analysis, so they force a clean build
+SPEC_KEY_FILE = Path(BUILD_WORK_PATH) / '.tidycore-spec-key'
+
+# Written next to the executable by a running TidyCore (see main.py)
+PID_FILE_NAME = 'TidyCore.pid'
+PROCESS_EXIT_TIMEOUT_SECONDS = 5
+
+# Thread count for packaging copies (I/O bound, so oversubscribe the CPUs)
+COPY_WORKERS = (os.cpu_count() or 1) * 2
+
+VERSION_PATTERN = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+
+@lru_cache(maxsize=None)
 def get_version():
     """Get the current version from the package."""
-    # Add src to path to import tidycore
-    sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+    # Read the string straight from __init__.py instead of importing the package
+    init_file = Path(__file__).parent.parent / 'src' / 'tidycore' / '__init__.py'
+    try:
+        match = VERSION_PATTERN.search(init_file.read_text(encoding='utf-8'))
+    except OSError:
+        match = None
+    if match:
+        return match.group(1)
+    print("Warning: Could not read version from tidycore. Using default version.")
+    return "1.0.0"
+
+def _remove_path(remove, path):
+    """Call remove(path), making path writable and retrying only if that fails."""
+    try:
+        remove(path)
+    except PermissionError:
+        # Read-only entries (common on Windows) only need chmod on failure
+        os.chmod(path, stat.S_IWRITE)
+        remove(path)
+
+def _remove_tree_contents(path):
+    """Delete everything under path in a single scandir pass."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree_contents(entry.path)
+                _remove_path(os.rmdir, entry.path)
+            else:
+                _remove_path(os.unlink, entry.path)
+
+def remove_tree(path):
+    """Delete a directory tree, preferring the OS's native bulk delete."""
+    if sys.platform == 'win32':
+        # cmd's rd deletes large trees much faster than a Python-level walk
+        subprocess.run(['cmd', '/c', 'rd', '/s', '/q', str(path)],
+                       capture_output=True, check=False)
+        if not os.path.exists(path):
+            return
+    _remove_tree_contents(path)
+    _remove_path(os.rmdir, path)
+
+def clean_build_directory(dir_name):
+    """Clean one build output directory."""
+    print(f"Cleaning {dir_name} directory...")
     try:
-        from tidycore import __version__
-        return __version__
-    except ImportError:
-        print("Warning: Could not import version from tidycore. Using default version.")
-        return "1.0.0"
+        remove_tree(dir_name)
+    except PermissionError as e:
+        print(f"Warning: Could not clean {dir_name}: {e}")
+        print("This may cause issues with the build. Close any running instances and try again.")
 
 def clean_build_directories():
     """Clean previous build directories."""
     # Change to parent directory to work with the project root
     os.chdir(Path(__file__).parent.parent)
     
-    dirs_to_clean = ['build', 'dist']
-    for dir_name in dirs_to_clean:
-        if Path(dir_name).exists():
-            print(f"Cleaning {dir_name} directory...")
-            try:
-                # Force remove any readonly files first
-                for root, dirs, files in os.walk(dir_name):
-                    for file in files:
-                        file_path = Path(root) / file
-                        try:
-                            file_path.chmod(0o777)  # Make writable
-                        except:
-                            pass
-                shutil.rmtree(dir_name)
-            except PermissionError as e:
-                print(f"Warning: Could not clean {dir_name}: {e}")
-                print("This may cause issues with the build. Close any running instances and try again.")
+    dirs_to_clean = [d for d in ('build', 'dist') if Path(d).exists()]
+    if not dirs_to_clean:
+        return
+    
+    # The directories are independent, so delete them concurrently
+    with ThreadPoolExecutor(max_workers=len(dirs_to_clean)) as executor:
+        list(executor.map(clean_build_directory, dirs_to_clean))
+
+def terminate_pid(pid, timeout=PROCESS_EXIT_TIMEOUT_SECONDS):
+    """Terminate pid and block until it exits, without polling."""
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        # Declare the signatures so 64-bit handles aren't truncated to a C int
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        SYNCHRONIZE, PROCESS_TERMINATE = 0x00100000, 0x0001
+        handle = kernel32.OpenProcess(SYNCHRONIZE | PROCESS_TERMINATE, False, pid)
+        if not handle:
+            return False
+        try:
+            kernel32.TerminateProcess(handle, 1)
+            return kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == 0
+        finally:
+            kernel32.CloseHandle(handle)
+    
+    try:
+        # A pidfd becomes readable when the process exits (Linux 5.3+)
+        pidfd = os.pidfd_open(pid) if hasattr(os, 'pidfd_open') else None
+    except OSError:
+        return False
+    try:
+        os.kill(pid, signal.SIGTERM)
+        if pidfd is None:
+            return True
+        return bool(select.select([pidfd], [], [], timeout)[0])
+    except ProcessLookupError:
+        return True
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+def is_tidycore_process(pid, started_before):
+    """Whether pid is a TidyCore process started no later than started_before (epoch seconds)."""
+    if psutil is None:
+        return False  # Can't verify, so don't trust the PID
+    try:
+        proc = psutil.Process(pid)
+        names = [proc.name()]
+        try:
+            names.append(os.path.basename(proc.exe()))
+        except (psutil.AccessDenied, OSError):
+            pass
+        # A stale PID file's PID may since have been reused by another program
+        return (any(Path(name).stem == 'TidyCore' for name in names if name)
+                and proc.create_time() <= started_before)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+def terminate_from_pid_file(pid_file):
+    """Terminate the instance recorded in pid_file; False if there is none or it can't be verified."""
+    try:
+        pid = int(pid_file.read_text().strip())
+        written_at = pid_file.stat().st_mtime
+    except (OSError, ValueError):
+        return False
+    if not is_tidycore_process(pid, written_at):
+        print(f"PID {pid} from {pid_file.name} is not a running TidyCore instance, ignoring it")
+        return False
+    print(f"Terminating process from {pid_file.name} (PID: {pid})")
+    return terminate_pid(pid)
+
+def terminate_by_name(name):
+    """Terminate every process whose name contains name, waiting on them together."""
+    if psutil is None:
+        print("psutil not available - cannot automatically terminate processes")
+        return
+    procs = [proc for proc in psutil.process_iter(['pid', 'name'])
+             if name in (proc.info['name'] or '')]
+    for proc in procs:
+        print(f"Terminating process: {proc.info['name']} (PID: {proc.info['pid']})")
+        proc.terminate()
+    psutil.wait_procs(procs, timeout=PROCESS_EXIT_TIMEOUT_SECONDS)
 
 def clean_release_directory(release_dir):
     """Clean a specific release directory with proper permission handling."""
@@ -55,17 +208,8 @@ def clean_release_directory(release_dir):
         
     print(f"Cleaning existing release directory: {release_dir}")
     try:
-        # Force remove any readonly files
-        for root, dirs, files in os.walk(release_dir):
-            for file in files:
-                file_path = Path(root) / file
-                try:
-                    file_path.chmod(0o777)  # Make writable
-                except:
-                    pass
-        
         # Try to remove the directory
-        shutil.rmtree(release_dir)
+        remove_tree(release_dir)
         return True
         
     except PermissionError as e:
@@ -74,145 +218,119 @@ def clean_release_directory(release_dir):
         
         # Try to kill any TidyCore processes that might be locking files
         try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name']):
-                if 'TidyCore' in proc.info['name']:
-                    print(f"Terminating process: {proc.info['name']} (PID: {proc.info['pid']})")
-                    proc.terminate()
-                    proc.wait(timeout=5)
-        except ImportError:
-            print("psutil not available - cannot automatically terminate processes")
+            if not terminate_from_pid_file(release_dir / PID_FILE_NAME):
+                terminate_by_name('TidyCore')
         except Exception as term_e:
             print(f"Warning: Could not terminate processes: {term_e}")
         
         # Try again after killing processes
         try:
-            shutil.rmtree(release_dir)
+            remove_tree(release_dir)
             return True
         except PermissionError:
             print("Please close any running TidyCore instances and try again.")
             return False
 
-def build_executable():
+def fingerprint_files(paths, salt=''):
+    """Hash the names, mtimes and sizes of paths into a cheap change stamp."""
+    digest = hashlib.blake2b(salt.encode(), usedforsecurity=False)
+    for path in sorted(paths):
+        st = os.stat(path)
+        digest.update(f'{Path(path).as_posix()}:{st.st_mtime_ns}:{st.st_size}\n'.encode())
+    return digest.hexdigest()
+
+def compute_build_key():
+    """Fingerprint the build inputs and interpreter version into a cache key."""
+    paths = []
+    for entry in BUILD_INPUTS:
+        if os.path.isdir(entry):
+            paths += [path for path in scan_files(entry)
+                      if '__pycache__' not in Path(path).parts]
+        elif os.path.isfile(entry):
+            paths.append(entry)
+    return fingerprint_files(paths, salt=sys.version)
+
+def spec_changed():
+    """Whether the spec differs from the one used for the last successful build."""
+    return (not SPEC_KEY_FILE.exists()
+            or SPEC_KEY_FILE.read_text() != fingerprint_files([SPEC_FILE]))
+
+def build_executable(quiet=False):
     """Build the executable using PyInstaller."""
+    build_key = compute_build_key()
+    if (Path('dist/TidyCore.exe').exists() and BUILD_KEY_FILE.exists()
+            and BUILD_KEY_FILE.read_text() == build_key):
+        print("✅ Build inputs unchanged, reusing dist/TidyCore.exe")
+        return True
+    
     print("Building TidyCore executable...")
+    # A failed or interrupted build must not leave a key that vouches for dist/
+    BUILD_KEY_FILE.unlink(missing_ok=True)
     
-    # PyInstaller command with options
-    cmd = [
-        'pyinstaller',
-        '--onefile',                    # Single file executable
-        '--windowed',                   # No console window
-        '--name=TidyCore',              # Executable name
-        '--icon=icon.png',              # Application icon
-        '--add-data=icon.png;.',        # Include icon file
-        '--add-data=config;config',     # Include config directory
-        '--paths=src',                  # Add src to Python path
-        '--hidden-import=PySide6.QtCore',
-        '--hidden-import=PySide6.QtWidgets',
-        '--hidden-import=PySide6.QtGui',
-        '--hidden-import=qtawesome',
-        '--hidden-import=requests',
-        '--hidden-import=packaging',
-        '--hidden-import=watchdog',
-        '--hidden-import=unicodedata',  # Fix for requests/idna module
-        '--hidden-import=_codecs',      # Core codec support
-        '--hidden-import=_locale',      # Locale support for unicode
-        '--hidden-import=_string',      # String operations
-        '--hidden-import=idna',
-        '--hidden-import=idna.core',    # Specific idna.core import
-        '--hidden-import=idna.idnadata', # Additional idna data
-        '--hidden-import=idna.uts46data', # Additional UTS46 data
-        '--hidden-import=encodings',    # Encoding support
-        '--hidden-import=encodings.utf_8', # UTF-8 encoding
-        '--hidden-import=encodings.ascii', # ASCII encoding
-        '--hidden-import=encodings.latin_1', # Latin-1 encoding
-        '--hidden-import=encodings.cp1252', # Windows encoding
-        '--hidden-import=encodings.utf_16', # UTF-16 encoding
-        '--hidden-import=encodings.utf_32', # UTF-32 encoding
-        '--hidden-import=encodings.idna', # IDNA encoding
-        '--hidden-import=charset_normalizer',
-        '--hidden-import=urllib3',
-        '--hidden-import=certifi',
-        '--hidden-import=ssl',          # SSL support
-        '--hidden-import=_ssl',         # Internal SSL module
-        '--hidden-import=_socket',      # Socket support
-        '--hidden-import=socket',       # Socket module
-        '--hidden-import=select',       # Select module for sockets
-        '--hidden-import=OpenSSL',      # OpenSSL support (if available)
-        '--hidden-import=cryptography', # Cryptography support
-        '--hidden-import=hashlib',      # Hash functions
-        '--hidden-import=hmac',         # HMAC support
-        '--hidden-import=zipfile',
-        '--hidden-import=tempfile',
-        '--hidden-import=shutil',
-        '--hidden-import=threading',    # For update manager
-        '--hidden-import=json',         # For config handling
-        '--hidden-import=pathlib',      # Path operations
-        '--hidden-import=webbrowser',   # For opening URLs
-        '--hidden-import=datetime',     # For date formatting
-        '--hidden-import=subprocess',   # For process management
-        '--hidden-import=platform',     # For system detection
-        '--hidden-import=locale',       # Locale support
-        '--hidden-import=codecs',       # Codec support
-        '--hidden-import=functools',    # Functools for requests
-        '--hidden-import=email',        # Email support for urllib3
-        '--hidden-import=email.message', # Email message support
-        '--hidden-import=email.mime',   # Email MIME support
-        '--hidden-import=email.mime.text', # Email MIME text support
-        '--hidden-import=typing_extensions', # Typing extensions
-        '--hidden-import=base64',       # Base64 encoding for certificates
-        '--hidden-import=binascii',     # Binary/ASCII conversions
-        '--hidden-import=_hashlib',     # Internal hashlib module
-        '--hidden-import=_random',      # Random number generation for SSL
-        '--collect-all=encodings',      # Collect all encodings
-        '--collect-all=idna',          # Collect all idna modules
-        '--collect-all=certifi',       # Collect all certifi modules
-        '--collect-data=encodings',     # Collect encoding data files
-        '--collect-data=certifi',       # Collect SSL certificates - CRITICAL for HTTPS
-        '--collect-data=idna',         # Collect IDNA data files
-        '--collect-submodules=ssl',     # Collect all SSL submodules
-        '--collect-submodules=certifi', # Collect all certifi submodules
-        '--collect-submodules=requests', # Collect all requests submodules
-        '--collect-submodules=urllib3',  # Collect all urllib3 submodules
-        '--collect-submodules=charset_normalizer', # Collect charset_normalizer
-        '--collect-submodules=idna',   # Collect all IDNA submodules
-        '--collect-submodules=unicodedata', # Collect all unicodedata submodules
-        # Additional PyInstaller options to fix Unicode and SSL issues
-        '--copy-metadata=certifi',     # Copy certifi metadata
-        '--copy-metadata=requests',    # Copy requests metadata
-        '--copy-metadata=urllib3',     # Copy urllib3 metadata
-        '--copy-metadata=idna',        # Copy idna metadata
-        '--copy-metadata=charset-normalizer', # Copy charset-normalizer metadata
-        # Additional hooks directory for custom hooks
-        '--additional-hooks-dir=scripts',    # Look for additional hooks in scripts dir
-        # Bundle Python standard library explicitly for problematic modules
-        '--collect-submodules=unicodedata', # Explicitly bundle unicodedata
-        # Force inclusion of critical low-level modules
-        '--hidden-import=_ctypes',     # Required for many extensions
-        '--hidden-import=ctypes',      # Higher level ctypes interface
-        '--hidden-import=ctypes.util', # Utility functions for ctypes
-        '--hidden-import=_decimal',    # Decimal module C extension
-        '--hidden-import=decimal',     # Decimal arithmetic
-        '--hidden-import=array',       # Array module
-        '--hidden-import=math',        # Math functions
-        '--hidden-import=_struct',     # Struct packing/unpacking
-        '--hidden-import=struct',      # Struct module
-        '--noupx',                     # Don't use UPX compression (can cause issues)
-        '--debug=imports',             # Debug import issues
-        'main.py'
+    # All PyInstaller options live in the spec file
+    pyinstaller_args = [
+        '--noconfirm',                  # Overwrite dist/ without prompting
+        f'--workpath={BUILD_WORK_PATH}', # Keep the analysis cache in a known place
+        SPEC_FILE,
     ]
+    if quiet:
+        pyinstaller_args.insert(0, '--log-level=WARN')
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Keep PyInstaller's cache in a stable location so it survives between runs.
+    # PyInstaller reads this when it is imported, so set it first.
+    os.environ.setdefault('PYINSTALLER_CONFIG_DIR', str(PYINSTALLER_CONFIG_DIR))
+    
+    # Run PyInstaller in this interpreter instead of starting a new one through
+    # its console script; it logs straight to the terminal as it goes
+    import PyInstaller.__main__
+    try:
+        PyInstaller.__main__.run(pyinstaller_args)
+        returncode = 0
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else 1
     
-    if result.returncode == 0:
+    if returncode == 0:
         print("✅ Build successful!")
+        BUILD_KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BUILD_KEY_FILE.write_text(build_key)
+        SPEC_KEY_FILE.write_text(fingerprint_files([SPEC_FILE]))
         return True
     else:
-        print("❌ Build failed!")
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
+        print(f"❌ Build failed! (PyInstaller exited with code {returncode})")
         return False
 
+def get_release_dir():
+    """Get the versioned release directory."""
+    return Path(f'release/TidyCore-v{get_version()}')
+
+def scan_files(directory):
+    """Yield the paths of all files under directory, using scandir's cached types."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+def collect_release_entries(files_to_include):
+    """List (source path, path inside the release) for every release file."""
+    entries = [(Path('dist/TidyCore.exe'), 'TidyCore.exe')]
+    entries += [(Path(file), file) for file in files_to_include]
+    if os.path.isdir('config'):
+        entries += [(Path(path), Path(path).as_posix()) for path in scan_files('config')]
+    return entries
+
+def write_zip(zip_path, entries):
+    """Write each (source path, archive name) entry into zip_path."""
+    # The PyInstaller executable is already compressed, so store it as-is
+    # instead of paying for a DEFLATE pass; only the small text files shrink.
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+        for source, arcname in entries:
+            if source.suffix.lower() == '.exe':
+                zf.write(source, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(source, arcname)
+
 def create_release_package():
     """Create the release package."""
     if not Path('dist/TidyCore.exe').exists():
@@ -224,95 +342,114 @@ def create_release_package():
     # Get current version
     version = get_version()
     
-    # Create versioned release directory (clean it first if it exists)
-    release_dir = Path(f'release/TidyCore-v{version}')
-    if not clean_release_directory(release_dir):
-        return False
-        return False
-    
+    # Create versioned release directory (main() has already cleaned it)
+    release_dir = get_release_dir()
     release_dir.mkdir(parents=True, exist_ok=True)
     
-    # Copy executable
-    try:
-        shutil.copy2('dist/TidyCore.exe', release_dir)
-    except PermissionError as e:
-        print(f"❌ Permission error copying executable: {e}")
-        print("Please ensure no TidyCore instances are running and try again.")
-        return False
-    
-    # Copy essential files
+    # Essential files shipped next to the executable
     files_to_include = [
         'README.md',
         'LICENSE',
         'icon.png'
     ]
+    # One directory listing instead of a stat per file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+    files_to_include = [file for file in files_to_include if file in present]
     
-    for file in files_to_include:
-        if Path(file).exists():
-            shutil.copy2(file, release_dir)
-    
-    # Copy config directory
-    config_src = Path('config')
-    config_dst = release_dir / 'config'
-    if config_src.exists():
-        shutil.copytree(config_src, config_dst, dirs_exist_ok=True)
+    release_entries = collect_release_entries(files_to_include)
     
     # Create ZIP file with proper naming for auto-update compatibility
     zip_name = f'TidyCore-v{version}-Windows.zip'
     zip_path = Path('release') / zip_name
     
-    print(f"Creating ZIP package: {zip_name}")
-    
-    # Create a temporary structure for the ZIP that's flat for easier extraction
-    temp_zip_dir = Path('release') / 'temp_for_zip'
-    temp_zip_dir.mkdir(exist_ok=True)
-    
-    # Copy files to temp directory with flat structure
-    shutil.copy2(release_dir / 'TidyCore.exe', temp_zip_dir)
-    for file in files_to_include:
-        if (release_dir / file).exists():
-            shutil.copy2(release_dir / file, temp_zip_dir)
-    
-    # Copy config directory to temp
-    if (release_dir / 'config').exists():
-        shutil.copytree(release_dir / 'config', temp_zip_dir / 'config', dirs_exist_ok=True)
-    
-    # Create ZIP from temp directory
-    shutil.make_archive(
-        str(zip_path.with_suffix('')),  # Remove .zip as make_archive adds it
-        'zip',
-        str(temp_zip_dir),  # Use temp_zip_dir as the root, not its parent
-        '.'     # Archive everything in the temp directory as root
-    )
-    
-    # Clean up temp directory
-    shutil.rmtree(temp_zip_dir)
+    # Copying is I/O bound, so threads overlap the per-file syscalls. The ZIP
+    # is written straight from the sources alongside the copies, with the flat
+    # layout the updater expects (TidyCore.exe at the root).
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        print(f"Creating ZIP package: {zip_name}")
+        zip_write = executor.submit(write_zip, zip_path, release_entries)
+        
+        copies = []
+        for source, arcname in release_entries:
+            target = release_dir / arcname
+            target.parent.mkdir(parents=True, exist_ok=True)
+            copies.append(executor.submit(shutil.copy2, source, target))
+        
+        # A running instance can lock the executable, so report that case clearly
+        try:
+            copies[0].result()
+        except PermissionError as e:
+            print(f"❌ Permission error copying executable: {e}")
+            print("Please ensure no TidyCore instances are running and try again.")
+            return False
+        for future in copies[1:]:
+            future.result()
+        zip_write.result()
     
     print(f"✅ Release package created in {release_dir}")
     print(f"✅ ZIP package created: {zip_path}")
     return True
 
-def main():
+def check_pyinstaller():
+    """Check that PyInstaller is installed for this interpreter."""
+    # find_spec only locates the package; importing it is left to the build
+    return find_spec('PyInstaller') is not None
+
+def parse_args(argv=None):
+    """Parse the build script's command line options."""
+    parser = argparse.ArgumentParser(description="Build a TidyCore release.")
+    parser.add_argument(
+        '--clean', action='store_true',
+        help="Remove build/ and dist/ before building (forces a full rebuild)."
+    )
+    parser.add_argument(
+        '--full', action='store_true',
+        help="Alias for --clean."
+    )
+    parser.add_argument(
+        '-q', '--quiet', action='store_true',
+        help="Only show PyInstaller's warnings and errors."
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main build process."""
+    args = parse_args(argv)
     print("🚀 Starting TidyCore release build...")
     
     # Get version
     version = get_version()
     print(f"📦 Building TidyCore v{version}")
     
-    # Check if PyInstaller is installed
-    try:
-        subprocess.run(['pyinstaller', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Work from the project root so relative paths resolve consistently
+    os.chdir(Path(__file__).parent.parent)
+
+    if not check_pyinstaller():
         print("❌ PyInstaller not found. Please install it with: pip install pyinstaller")
         return 1
-    
-    # Clean previous builds
-    clean_build_directories()
-    
-    # Build executable
-    if not build_executable():
-        return 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Only wipe previous builds when asked or when the spec changed; otherwise
+        # PyInstaller reuses its cached analysis in build/ and rebuilds incrementally.
+        if args.clean or args.full or spec_changed():
+            clean_build_directories()
+        else:
+            print("♻️  Reusing previous build cache (pass --clean for a full rebuild)")
+        
+        # Remove the previous release directory while PyInstaller runs
+        release_cleaned = executor.submit(clean_release_directory, get_release_dir())
+        
+        # Build executable
+        if not build_executable(quiet=args.quiet):
+            return 1
+        
+        try:
+            if not release_cleaned.result():
+                return 1
+        except OSError as e:
+            print(f"❌ Failed to clean release directory: {e}")
+            return 1
     
     # Create release package
     if not create_release_package():
@@ -5,28 +5,43 @@ Script to manage version updates for TidyCore releases.
 import re
 from pathlib import Path
 
+INIT_FILE = Path("src/tidycore/__init__.py")
+VERSION_PATTERN = re.compile(r'^__version__ = ["\']([^"\']+)["\']', re.MULTILINE)
+
+def _parse_version(content):
+    """Extract the version string from the content of __init__.py"""
+    match = VERSION_PATTERN.search(content)
+    return match.group(1) if match else "2.0.0"
+
 def get_current_version():
     """Get the current version from __init__.py"""
-    init_file = Path("src/tidycore/__init__.py")
-    content = init_file.read_text()
-    match = re.search(r'__version__ = ["\']([^"\']+)["\']', content)
-    return match.group(1) if match else "2.0.0"
+    return _parse_version(INIT_FILE.read_text(encoding="utf-8"))
+
+def _rewrite_version(new_version_for):
+    """Replace the version in __init__.py through a single file handle,
+    writing only if it changed. new_version_for maps the current version
+    to the new one."""
+    with INIT_FILE.open("r+", encoding="utf-8") as f:
+        content = f.read()
+        new_version = new_version_for(_parse_version(content))
+        new_content = VERSION_PATTERN.sub(
+            f'__version__ = "{new_version}"',
+            content,
+            count=1
+        )
+        if new_content != content:
+            f.seek(0)
+            f.write(new_content)
+            f.truncate()
+            print(f"Updated version to {new_version}")
+    return new_version
 
 def update_version(new_version):
     """Update the version in __init__.py"""
-    init_file = Path("src/tidycore/__init__.py")
-    content = init_file.read_text()
-    new_content = re.sub(
-        r'__version__ = ["\'][^"\']+["\']',
-        f'__version__ = "{new_version}"',
-        content
-    )
-    init_file.write_text(new_content)
-    print(f"Updated version to {new_version}")
+    _rewrite_version(lambda current: new_version)
 
-def increment_version(version_type="patch"):
-    """Increment version number (major.minor.patch)"""
-    current = get_current_version()
+def _bump(current, version_type):
+    """Return current bumped by version_type (major.minor.patch)"""
     parts = current.split(".")
     
     if len(parts) != 3:
@@ -45,9 +60,11 @@ def increment_version(version_type="patch"):
     else:  # patch
         patch += 1
     
-    new_version = f"{major}.{minor}.{patch}"
-    update_version(new_version)
-    return new_version
+    return f"{major}.{minor}.{patch}"
+
+def increment_version(version_type="patch"):
+    """Increment version number (major.minor.patch)"""
+    return _rewrite_version(lambda current: _bump(current, version_type))
 
 if __name__ == "__main__":
     import sys
@@ -15,6 +15,26 @@ except ImportError as e:
     logging.getLogger("TidyCore").warning(f"Failed to import update_manager: {e}")
     update_manager = None
 
+# Shared by every AboutPage instance, so the gradient QSS is built once per process
+_UPDATE_BTN_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+            stop:0 #7aa2f7, stop:1 #7dcfff);
+        color: #23243a;
+        border: none;
+        font-size: 14px;
+        padding: 10px 20px;
+        border-radius: 8px;
+        font-weight: 600;
+        margin: 10px 0;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+            stop:0 #bb9af7, stop:1 #7aa2f7);
+        color: #fff;
+    }
+"""
+
 class AboutPage(QWidget):
     """The 'About' page for the TidyCore application."""
     def __init__(self, parent=None):
@@ -30,10 +50,22 @@ class AboutPage(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll_area)
         
-        content_widget = QWidget()
-        scroll_area.setWidget(content_widget)
+        self.content_widget = QWidget()
+        scroll_area.setWidget(self.content_widget)
         
-        layout = QVBoxLayout(content_widget)
+        # The sections are built the first time the page is shown, since most
+        # sessions never open the About page
+        self._built = False
+
+    def showEvent(self, event):
+        """Build the page sections on first show."""
+        if not self._built:
+            self._build_sections()
+            self._built = True
+        super().showEvent(event)
+
+    def _build_sections(self):
+        layout = QVBoxLayout(self.content_widget)
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         layout.setSpacing(20)
         
@@ -143,24 +175,7 @@ class AboutPage(QWidget):
         
         # Check for updates button
         update_button = QPushButton("Check for Updates")
-        update_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #7aa2f7, stop:1 #7dcfff);
-                color: #23243a;
-                border: none;
-                font-size: 14px;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: 600;
-                margin: 10px 0;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #bb9af7, stop:1 #7aa2f7);
-                color: #fff;
-            }
-        """)
+        update_button.setStyleSheet(_UPDATE_BTN_QSS)
         
         # Connect button based on update_manager availability
         if update_manager:
@@ -1,12 +1,37 @@
 # tidycore/config_manager.py
+import copy
 import json
 import os
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
 from .utils import get_absolute_path
 from pathlib import Path
 
 CONFIG_PATH = get_absolute_path("config/config.json")
 
+# The parsed and normalized config, keyed by the file's (mtime, size) so an
+# unchanged file is not re-read and re-normalized on every load.
+_config_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+# The last target folder that passed validation and when (time.monotonic()).
+# The check is repeated only if the target changes or this goes stale, since
+# isdir() on a network-mounted folder can block.
+TARGET_REVALIDATE_SECONDS = 60
+_validated_target: Optional[Tuple[str, float]] = None
+
+def _normalize_rules(rules: Dict[str, Any]) -> Dict[str, Any]:
+    """Lowercases all file extensions for consistent matching."""
+    return {
+        category: (
+            [ext.lower() for ext in extensions] if isinstance(extensions, list)
+            else {sub_category: [ext.lower() for ext in sub_extensions]
+                  for sub_category, sub_extensions in extensions.items()}
+            if isinstance(extensions, dict)
+            else extensions
+        )
+        for category, extensions in rules.items()
+    }
+
 def load_config() -> Dict[str, Any]:
     """
     Loads and resolves the configuration file.
@@ -19,41 +44,64 @@ def load_config() -> Dict[str, Any]:
         FileNotFoundError: If the config file cannot be found.
         ValueError: If the target folder in the config does not exist.
     """
+    global _config_cache, _validated_target
     path = CONFIG_PATH
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Configuration file not found at: {path}")
-
-    with open(path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
-
-    # --- Path Resolution Logic ---
-    target_folder = config.get("target_folder")
-    if target_folder == "{USER_DOWNLOADS}":
-        # Find the user's home directory and append 'Downloads'
-        # This works on Windows, macOS, and Linux.
-        downloads_path = Path.home() / "Downloads"
-        config["target_folder"] = str(downloads_path)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found at: {path}") from None
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+
+    if _config_cache is not None and _config_cache[0] == cache_key:
+        # Callers modify the returned dict, so always hand out a copy
+        config = copy.deepcopy(_config_cache[1])
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+
+        # --- Path Resolution Logic ---
+        target_folder = config.get("target_folder")
+        if target_folder == "{USER_DOWNLOADS}":
+            # Find the user's home directory and append 'Downloads'
+            # This works on Windows, macOS, and Linux.
+            downloads_path = Path.home() / "Downloads"
+            config["target_folder"] = str(downloads_path)
+
+        # Normalize file extensions to lowercase for consistent matching
+        rules = config.get("rules", {})
+        if rules: # Ensure rules exist before trying to iterate
+            config["rules"] = _normalize_rules(rules)
+
+        _config_cache = (cache_key, copy.deepcopy(config))
         
     # Validate that the final target folder exists
     # Use .get() to avoid a KeyError if target_folder is missing from config
     resolved_target = config.get("target_folder")
-    if not resolved_target or not os.path.isdir(resolved_target):
-        raise ValueError(
-            f"The target folder '{resolved_target}' is invalid or does not exist."
-        )
-    
-    # Normalize file extensions to lowercase for consistent matching
-    rules = config.get("rules", {})
-    if rules: # Ensure rules exist before trying to iterate
-        for category, extensions in rules.items():
-            if isinstance(extensions, list):
-                config["rules"][category] = [ext.lower() for ext in extensions]
-            elif isinstance(extensions, dict):
-                for sub_category, sub_extensions in extensions.items():
-                    config["rules"][category][sub_category] = [ext.lower() for ext in sub_extensions]
+    now = time.monotonic()
+    if (_validated_target is None or _validated_target[0] != resolved_target
+            or now - _validated_target[1] > TARGET_REVALIDATE_SECONDS):
+        if not resolved_target or not os.path.isdir(resolved_target):
+            _validated_target = None
+            raise ValueError(
+                f"The target folder '{resolved_target}' is invalid or does not exist."
+            )
+        _validated_target = (resolved_target, now)
 
     return config
 
+def config_signature() -> Optional[Tuple[int, int]]:
+    """
+    Returns the config file's (mtime, size), or None if it is missing.
+
+    A cheap way for callers to tell whether the file changed since they last
+    loaded or saved it.
+    """
+    try:
+        stat = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 def save_config(config_data: Dict[str, Any]):
     """
     Saves the provided configuration dictionary to the config file.
@@ -61,7 +109,11 @@ def save_config(config_data: Dict[str, Any]):
     Args:
         config_data (Dict[str, Any]): The configuration dictionary to save.
     """
+    global _config_cache
     path = CONFIG_PATH
+    # Drop the cache first; a save within the filesystem's mtime granularity
+    # could otherwise leave a stale entry that still matches.
+    _config_cache = None
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(config_data, f, indent=2)
 
@@ -73,4 +125,8 @@ class ConfigManager:
     
     def save_config(self, config_data: Dict[str, Any]):
         """Saves config to the default path."""
-        save_config(config_data)
\ No newline at end of file
+        save_config(config_data)
+
+    def get_signature(self) -> Optional[Tuple[int, int]]:
+        """Returns the (mtime, size) signature of the config file."""
+        return config_signature()
\ No newline at end of file
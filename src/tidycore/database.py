@@ -1,107 +1,491 @@
 # tidycore/database.py
 import sqlite3
 import logging
-from datetime import datetime, date
+import queue
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, date, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 from .utils import get_absolute_path
 
+# Per-connection tuning. WAL lets the dashboard's reads run alongside writes,
+# and with synchronous=NORMAL a commit no longer waits on an fsync.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",     # 64 MB page cache
+    "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout=5000",
+)
+
+# How long the dashboard getters may answer from memory. Any queued write
+# invalidates the cache immediately, so these only bound repeated polling.
+TODAY_STATS_TTL_SECONDS = 1.0
+WEEKLY_STATS_TTL_SECONDS = 60.0
+
+# Most queued batches the writer thread folds into one transaction
+WRITER_MAX_BATCHES = 64
+
+# file_operations rows older than this are pruned, at most once a day
+DEFAULT_RETENTION_DAYS = 90
+PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+# Free pages handed back to the OS after each prune, unless more than
+# VACUUM_FREE_PAGE_RATIO of the file is free, when all of them are
+PRUNE_VACUUM_PAGES = 1024
+
+# Rebuild the file with VACUUM at startup once this share of its pages is free
+VACUUM_FREE_PAGE_RATIO = 0.25
+
+# The connection keeps this many compiled statements; every query below is a
+# static string, so each is prepared once and then reused.
+STATEMENT_CACHE_SIZE = 256
+
+_SQL_CREATE_DAILY_STATS = """
+    CREATE TABLE IF NOT EXISTS daily_stats (
+        date TEXT PRIMARY KEY,
+        files_organized INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+_SQL_CREATE_FILE_OPERATIONS = """
+    CREATE TABLE IF NOT EXISTS file_operations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        source_path TEXT NOT NULL,
+        destination_path TEXT NOT NULL,
+        category TEXT NOT NULL,
+        subcategory TEXT,
+        operation_type TEXT DEFAULT 'organize',
+        timestamp INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )
+"""
+
+# The last week of daily_stats, kept current by triggers so the dashboard's
+# weekly chart reads a handful of rows instead of range-scanning daily_stats.
+# Triggers fired by an UPSERT inherit its conflict policy (OR REPLACE would be
+# ignored), so the row for NEW.date is deleted and re-inserted instead.
+_SQL_CREATE_WEEKLY_ROLLUP = """
+    CREATE TABLE IF NOT EXISTS weekly_rollup (
+        date TEXT PRIMARY KEY,
+        files_organized INTEGER NOT NULL
+    )
+"""
+
+_SQL_CREATE_WEEKLY_ROLLUP_TRIGGERS = tuple(f"""
+    CREATE TRIGGER IF NOT EXISTS trg_daily_after_{event.lower()} AFTER {event} ON daily_stats
+    BEGIN
+        DELETE FROM weekly_rollup
+        WHERE date = NEW.date OR date < date(NEW.date, '-7 days');
+        INSERT INTO weekly_rollup (date, files_organized)
+        VALUES (NEW.date, NEW.files_organized);
+    END
+""" for event in ("INSERT", "UPDATE"))
+
+# Databases created before the rollup start from their recent daily_stats
+_SQL_SEED_WEEKLY_ROLLUP = """
+    INSERT OR IGNORE INTO weekly_rollup (date, files_organized)
+    SELECT date, files_organized FROM daily_stats
+    WHERE date >= date('now', '-7 days')
+"""
+
+# Earlier releases stored file_operations.timestamp as 'YYYY-MM-DD HH:MM:SS'
+# UTC text; rebuild the table with Unix epoch seconds (the indexes on it are
+# dropped with the old table and recreated afterwards)
+_SQL_MIGRATE_OPERATIONS_TO_EPOCH = (
+    "ALTER TABLE file_operations RENAME TO file_operations_old",
+    _SQL_CREATE_FILE_OPERATIONS,
+    """
+    INSERT INTO file_operations
+    (id, filename, source_path, destination_path, category, subcategory, operation_type, timestamp)
+    SELECT id, filename, source_path, destination_path, category, subcategory, operation_type,
+           COALESCE(CAST(strftime('%s', timestamp) AS INTEGER), CAST(strftime('%s', 'now') AS INTEGER))
+    FROM file_operations_old
+    """,
+    "DROP TABLE file_operations_old",
+)
+
+_SQL_CREATE_CATEGORY_STATS = """
+    CREATE TABLE IF NOT EXISTS category_stats (
+        date TEXT,
+        category TEXT,
+        count INTEGER DEFAULT 0,
+        PRIMARY KEY (date, category)
+    )
+"""
+
+# Running totals, kept in step with the tables they summarize so reading
+# them is a primary-key lookup instead of an aggregate over every day
+_SQL_CREATE_META = """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL DEFAULT 0
+    )
+"""
+
+# Databases created before the meta table start from their existing total
+_SQL_SEED_TOTAL = """
+    INSERT OR IGNORE INTO meta (key, value)
+    SELECT 'total_files', COALESCE(SUM(files_organized), 0) FROM daily_stats
+"""
+
+# Serve the dashboard queries from an index: the newest operations, and one
+# day's categories by count. The category/time index is for filtered views.
+_SQL_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_ops_ts ON file_operations(timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_ops_category_ts ON file_operations(category, timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_cat_date_count ON category_stats(date, count DESC)",
+)
+
+_SQL_INSERT_OPERATION = """
+    INSERT INTO file_operations 
+    (filename, source_path, destination_path, category, subcategory)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_DAILY = """
+    INSERT INTO daily_stats (date, files_organized) VALUES (?, ?)
+    ON CONFLICT(date) DO UPDATE
+    SET files_organized = files_organized + excluded.files_organized
+"""
+
+_SQL_UPSERT_CATEGORY = """
+    INSERT INTO category_stats (date, category, count) VALUES (?, ?, ?)
+    ON CONFLICT(date, category) DO UPDATE
+    SET count = count + excluded.count
+"""
+
+_SQL_PRUNE_OPERATIONS = "DELETE FROM file_operations WHERE timestamp < ?"
+
+_SQL_SELECT_TODAY = "SELECT files_organized FROM daily_stats WHERE date = ?"
+
+_SQL_ADD_TO_TOTAL = "UPDATE meta SET value = value + ? WHERE key = 'total_files'"
+
+_SQL_SELECT_TOTAL = "SELECT value FROM meta WHERE key = 'total_files'"
+
+_SQL_SELECT_CATEGORIES_FOR_DATE = """
+    SELECT category, count FROM category_stats 
+    WHERE date = ? ORDER BY count DESC
+"""
+
+# The cutoff is bound by the caller, as the rollup may still hold older days
+# if nothing was organized recently
+_SQL_SELECT_WEEKLY = """
+    SELECT date, files_organized FROM weekly_rollup 
+    WHERE date >= ?
+    ORDER BY date DESC
+"""
+
+_SQL_SELECT_RECENT_OPERATIONS = """
+    SELECT filename, category, subcategory, timestamp
+    FROM file_operations 
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+
+# today's ISO date and the time.time() it was computed, reused for a second
+# so bulk writes and polling getters don't each call date.today()
+_today_cache: Tuple[float, str] = (0.0, "")
+
+def _today_iso() -> str:
+    """Return today's date as an ISO string, recomputed at most once per second."""
+    global _today_cache
+    now = time.time()
+    if now - _today_cache[0] > 1.0:
+        _today_cache = (now, date.today().isoformat())
+    return _today_cache[1]
+
 class StatisticsDatabase:
     """Manages the SQLite database for tracking file organization statistics."""
     
     def __init__(self):
         self.db_path = get_absolute_path("tidycore_stats.db")
         self.logger = logging.getLogger("TidyCore")
+        # One connection shared by the engine and GUI threads, serialized by the lock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Writes are queued as (date, operations) and committed by a background
+        # thread, so the engine doesn't wait on disk for every batch
+        self._queue: "queue.Queue[Optional[Tuple[str, list]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # Getter results by key, as (time.monotonic(), value); bumping the
+        # generation on each queued and committed write keeps a read that
+        # raced it from being cached
+        self._read_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._write_generation = 0
+        # Days of file_operations history to keep (None or 0 keeps everything);
+        # set from the "stats_retention_days" config option by the engine
+        self.retention_days: Optional[int] = DEFAULT_RETENTION_DAYS
+        self._last_prune: Optional[float] = None
+        # Set once the startup VACUUM check is done; the writer waits for it
+        # rather than failing with "database is locked" mid-VACUUM
+        self._vacuum_done = threading.Event()
         self._init_database()
+        threading.Thread(
+            target=self._vacuum_if_fragmented, daemon=True, name="TidyCoreStatsVacuum"
+        ).start()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with the tuning PRAGMAs applied."""
+        # Autocommit mode: a lone statement commits by itself, and multi-statement
+        # writes use an explicit BEGIN IMMEDIATE/COMMIT in _transaction(). This
+        # skips the implicit BEGIN the sqlite3 module would otherwise insert.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use. Call with the lock held."""
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and run the enclosed writes as a single transaction."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def _ensure_writer(self):
+        """Start the background writer thread if it isn't running."""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._drain_loop, daemon=True, name="TidyCoreStatsWriter"
+            )
+            self._writer.start()
+    
+    def _drain_loop(self):
+        """Commit queued batches, folding whatever is waiting into one transaction."""
+        self._vacuum_done.wait()
+        while True:
+            batches = [self._queue.get()]
+            while len(batches) < WRITER_MAX_BATCHES:
+                try:
+                    batches.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = None in batches
+            try:
+                self._write_batches([batch for batch in batches if batch is not None])
+                self._prune_if_due()
+            finally:
+                # Always release flush() waiters, even if the write blew up
+                for _ in batches:
+                    self._queue.task_done()
+            if stop:
+                return
+    
+    def _prune_if_due(self):
+        """Delete operations older than the retention period, at most once a day."""
+        now = time.monotonic()
+        if not self.retention_days or (
+                self._last_prune is not None and now - self._last_prune < PRUNE_INTERVAL_SECONDS):
+            return
+        self._last_prune = now
+        try:
+            cutoff = int(time.time()) - int(self.retention_days) * 24 * 60 * 60
+            with self._lock:
+                conn = self._get_connection()
+                # A single statement commits on its own in autocommit mode
+                conn.execute(_SQL_PRUNE_OPERATIONS, (cutoff,))
+                page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+                free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                # Otherwise a large prune would leave enough free pages to
+                # trigger a full VACUUM on the next start
+                pages = 0 if free_pages > page_count * VACUUM_FREE_PAGE_RATIO else PRUNE_VACUUM_PAGES
+                # Each step of this pragma frees one page and it returns no rows, so
+                # execute() would stop after the first; executescript() runs it out
+                conn.executescript(f"PRAGMA incremental_vacuum({pages})")
+                
+        except sqlite3.Error as e:
+            self.logger.error(f"Database prune error: {e}")
+    
+    def flush(self):
+        """Block until every queued operation has been written."""
+        if self._queue.unfinished_tasks:
+            self._ensure_writer()  # Restart a writer that died with batches still queued
+        self._queue.join()
+    
+    def close(self):
+        """Write any queued operations and close the shared connection. A later call reopens it."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    # Refresh planner statistics for the tables this session changed
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Database optimize error: {e}")
+                self._conn.close()
+                self._conn = None
     
     def _init_database(self):
         """Initialize the database and create tables if they don't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Table for daily statistics
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS daily_stats (
-                        date TEXT PRIMARY KEY,
-                        files_organized INTEGER DEFAULT 0,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
+            with self._lock:
+                # Lets freed pages be returned to the OS in small steps. This only
+                # applies to a new, empty file; existing databases are switched
+                # over by the next VACUUM (see _vacuum_if_fragmented).
+                self._get_connection().execute("PRAGMA auto_vacuum=INCREMENTAL")
                 
-                # Table for detailed file operations
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS file_operations (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        filename TEXT NOT NULL,
-                        source_path TEXT NOT NULL,
-                        destination_path TEXT NOT NULL,
-                        category TEXT NOT NULL,
-                        subcategory TEXT,
-                        operation_type TEXT DEFAULT 'organize',
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
+                # WAL is stored in the database file, so it only has to be set once.
+                # SQLite silently keeps the old mode where WAL is unsupported
+                # (e.g. some network filesystems), so check what it reports.
+                journal_mode = self._get_connection().execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if journal_mode.lower() != "wal":
+                    self.logger.warning(f"Database WAL mode unavailable, using '{journal_mode}' journal mode")
+            
+            with self._transaction() as conn:
+                conn.execute(_SQL_CREATE_DAILY_STATS)            # Daily statistics
+                conn.execute(_SQL_CREATE_FILE_OPERATIONS)        # Detailed file operations
+                conn.execute(_SQL_CREATE_CATEGORY_STATS)         # Category statistics
+                conn.execute(_SQL_CREATE_META)                   # Running totals
+                conn.execute(_SQL_CREATE_WEEKLY_ROLLUP)          # Last week of daily totals
+                for statement in _SQL_CREATE_WEEKLY_ROLLUP_TRIGGERS:
+                    conn.execute(statement)
+                conn.execute(_SQL_SEED_WEEKLY_ROLLUP)
+                if self._operations_use_text_timestamps(conn):
+                    for statement in _SQL_MIGRATE_OPERATIONS_TO_EPOCH:
+                        conn.execute(statement)
+                conn.execute(_SQL_SEED_TOTAL)
+                for statement in _SQL_CREATE_INDEXES:
+                    conn.execute(statement)
                 
-                # Table for category statistics
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS category_stats (
-                        date TEXT,
-                        category TEXT,
-                        count INTEGER DEFAULT 0,
-                        PRIMARY KEY (date, category)
-                    )
-                """)
-                
-                conn.commit()
-                self.logger.info("Database initialized successfully")
+            self.logger.info("Database initialized successfully")
                 
         except sqlite3.Error as e:
             self.logger.error(f"Database initialization error: {e}")
     
+    @staticmethod
+    def _operations_use_text_timestamps(conn: sqlite3.Connection) -> bool:
+        """Whether file_operations still has the old text timestamp column."""
+        for _, name, column_type, *_ in conn.execute("PRAGMA table_info(file_operations)"):
+            if name == "timestamp":
+                return column_type.upper() != "INTEGER"
+        return False
+    
+    def _vacuum_if_fragmented(self):
+        """VACUUM the database if it is fragmented or not yet in incremental auto-vacuum mode.
+        
+        Runs on its own connection without the shared lock, so reads carry on
+        against the last committed snapshot while the file is rebuilt.
+        """
+        conn = None
+        try:
+            conn = self._connect()
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            # 2 is INCREMENTAL
+            if auto_vacuum == 2 and free_pages <= page_count * VACUUM_FREE_PAGE_RATIO:
+                return
+            self.logger.info("Compacting statistics database...")
+            # The mode to switch to is per connection, so set it on this one
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+        except sqlite3.Error as e:
+            self.logger.warning(f"Database vacuum error: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+            self._vacuum_done.set()
+    
     def record_file_operation(self, filename: str, source_path: str, 
                             destination_path: str, category: str, 
                             subcategory: Optional[str] = None):
         """Record a file organization operation."""
+        self.record_file_operations([
+            (filename, source_path, destination_path, category, subcategory)
+        ])
+    
+    def record_file_operations(self, operations: List[Tuple[str, str, str, str, Optional[str]]]):
+        """
+        Queue a batch of file organization operations to be written in a single
+        transaction. Each operation is a (filename, source_path, destination_path,
+        category, subcategory) tuple.
+        """
+        if not operations:
+            return
+        # Dated now, so a batch queued just before midnight counts for that day
+        self._queue.put((_today_iso(), list(operations)))
+        self._write_generation += 1
+        self._read_cache.clear()
+        self._ensure_writer()
+    
+    def _write_batches(self, batches: List[Tuple[str, list]]):
+        """Write queued (date, operations) batches in one transaction.
+        
+        Batches are merged first, so each table gets a single statement
+        dispatch however many batches (or days) were queued.
+        """
+        if not batches:
+            return
+        
+        all_operations = []
+        daily_counts = Counter()
+        category_counts = Counter()
+        for day, operations in batches:
+            all_operations.extend(operations)
+            daily_counts[day] += len(operations)
+            category_counts.update((day, operation[3]) for operation in operations)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Insert file operation
-                cursor.execute("""
-                    INSERT INTO file_operations 
-                    (filename, source_path, destination_path, category, subcategory)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (filename, source_path, destination_path, category, subcategory))
-                
-                # Update daily stats
-                today = date.today().isoformat()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO daily_stats (date, files_organized)
-                    VALUES (?, COALESCE((SELECT files_organized FROM daily_stats WHERE date = ?), 0) + 1)
-                """, (today, today))
-                
-                # Update category stats
-                cursor.execute("""
-                    INSERT OR REPLACE INTO category_stats (date, category, count)
-                    VALUES (?, ?, COALESCE((SELECT count FROM category_stats WHERE date = ? AND category = ?), 0) + 1)
-                """, (today, category, today, category))
-                
-                conn.commit()
+            with self._transaction() as conn:
+                conn.executemany(_SQL_INSERT_OPERATION, all_operations)
+                conn.executemany(_SQL_UPSERT_DAILY, daily_counts.items())
+                conn.executemany(_SQL_UPSERT_CATEGORY, [
+                    (day, category, count) for (day, category), count in category_counts.items()
+                ])
+                conn.execute(_SQL_ADD_TO_TOTAL, (len(all_operations),))
                 
         except sqlite3.Error as e:
             self.logger.error(f"Database record error: {e}")
+        finally:
+            # Reads don't wait for the writer, so one made while these batches were
+            # queued may have cached the old counts; drop it now they're committed
+            self._write_generation += 1
+            self._read_cache.clear()
+    
+    def _read_through_cache(self, key: Tuple, ttl: float, load: Callable[[], Any]) -> Any:
+        """Return the cached value for key if younger than ttl, otherwise load() and cache it."""
+        now = time.monotonic()
+        entry = self._read_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        
+        generation = self._write_generation
+        value = load()
+        if generation == self._write_generation:
+            self._read_cache[key] = (now, value)
+        return value
+    
+    def _query_today_stats(self, today: str) -> int:
+        with self._lock:
+            result = self._get_connection().execute(_SQL_SELECT_TODAY, (today,)).fetchone()
+        return result[0] if result else 0
     
     def get_today_stats(self) -> int:
         """Get the number of files organized today."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                today = date.today().isoformat()
-                
-                cursor.execute("SELECT files_organized FROM daily_stats WHERE date = ?", (today,))
-                result = cursor.fetchone()
-                return result[0] if result else 0
+            today = _today_iso()
+            return self._read_through_cache(
+                ("today", today), TODAY_STATS_TTL_SECONDS, lambda: self._query_today_stats(today)
+            )
                 
         except sqlite3.Error as e:
             self.logger.error(f"Database query error: {e}")
@@ -110,48 +494,44 @@ class StatisticsDatabase:
     def get_total_stats(self) -> int:
         """Get the total number of files organized."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT SUM(files_organized) FROM daily_stats")
-                result = cursor.fetchone()
-                return result[0] if result and result[0] else 0
+            with self._lock:
+                result = self._get_connection().execute(_SQL_SELECT_TOTAL).fetchone()
+            return result[0] if result and result[0] else 0
                 
         except sqlite3.Error as e:
             self.logger.error(f"Database query error: {e}")
             return 0
     
+    def _query_category_stats(self, day: str) -> Dict[str, int]:
+        with self._lock:
+            # Build the dict straight from the cursor, without a fetchall() list
+            cursor = self._get_connection().execute(_SQL_SELECT_CATEGORIES_FOR_DATE, (day,))
+            return {category: count for category, count in cursor}
+    
     def get_category_stats_today(self) -> Dict[str, int]:
         """Get today's category breakdown."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                today = date.today().isoformat()
-                
-                cursor.execute("""
-                    SELECT category, count FROM category_stats 
-                    WHERE date = ? ORDER BY count DESC
-                """, (today,))
-                
-                return dict(cursor.fetchall())
+            today = _today_iso()
+            return dict(self._read_through_cache(
+                ("categories", today), TODAY_STATS_TTL_SECONDS, lambda: self._query_category_stats(today)
+            ))
                 
         except sqlite3.Error as e:
             self.logger.error(f"Database query error: {e}")
             return {}
     
+    def _query_weekly_stats(self) -> List[Tuple[str, int]]:
+        cutoff = (date.today() - timedelta(days=7)).isoformat()
+        with self._lock:
+            return self._get_connection().execute(_SQL_SELECT_WEEKLY, (cutoff,)).fetchall()
+    
     def get_weekly_stats(self) -> List[Tuple[str, int]]:
         """Get the last 7 days of statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT date, files_organized FROM daily_stats 
-                    WHERE date >= date('now', '-7 days')
-                    ORDER BY date DESC
-                """)
-                
-                return cursor.fetchall()
+            # Keyed by date so the window moves at midnight
+            return list(self._read_through_cache(
+                ("weekly", _today_iso()), WEEKLY_STATS_TTL_SECONDS, self._query_weekly_stats
+            ))
                 
         except sqlite3.Error as e:
             self.logger.error(f"Database query error: {e}")
@@ -160,26 +540,19 @@ class StatisticsDatabase:
     def get_recent_operations(self, limit: int = 10) -> List[Dict]:
         """Get recent file operations."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT filename, category, subcategory, timestamp
-                    FROM file_operations 
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                """, (limit,))
-                
-                operations = []
-                for row in cursor.fetchall():
-                    operations.append({
-                        'filename': row[0],
-                        'category': row[1],
-                        'subcategory': row[2],
-                        'timestamp': row[3]
-                    })
-                
-                return operations
+            with self._lock:
+                cursor = self._get_connection().cursor()
+                # sqlite3.Row maps column names to values, so each row converts directly
+                cursor.row_factory = sqlite3.Row
+                cursor.execute(_SQL_SELECT_RECENT_OPERATIONS, (limit,))
+                operations = [dict(row) for row in cursor]
+            
+            # Stored as epoch seconds; callers get the same UTC text as before
+            for operation in operations:
+                operation['timestamp'] = datetime.fromtimestamp(
+                    operation['timestamp'], timezone.utc
+                ).strftime('%Y-%m-%d %H:%M:%S')
+            return operations
                 
         except sqlite3.Error as e:
             self.logger.error(f"Database query error: {e}")
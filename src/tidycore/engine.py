@@ -3,8 +3,10 @@ import os
 import shutil
 import time
 import logging
+import threading
+from datetime import date
 from pathlib import Path
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -12,6 +14,13 @@ from .signals import signals
 from .config_manager import ConfigManager
 from .database import statistics_db
 
+# Category for anything no rule matches
+DEFAULT_CATEGORY: Tuple[str, Optional[str]] = ("Others", None)
+
+# Moves are recorded in the database in batches; a batch is written at the end
+# of each processing pass or once it reaches this many operations.
+OPERATION_BATCH_SIZE = 100
+
 class TidyCoreEngine(FileSystemEventHandler):
     """
     The core engine for TidyCore. It watches the target directory
@@ -23,39 +32,51 @@ class TidyCoreEngine(FileSystemEventHandler):
         self.logger = logging.getLogger("TidyCore")
         self.target_folder = Path(self.config["target_folder"])
         self.rules = self.config.get("rules", {})
+        self.extension_index = self._build_extension_index(self.rules)
         self.ignore_list = self.config.get("ignore_list", [])
         self.cooldown_period = self.config.get("cooldown_period_seconds", 5)
+        statistics_db.retention_days = self.config.get("stats_retention_days", statistics_db.retention_days)
         self.managed_categories = list(self.rules.keys()) + ["Others"]
         self.config_manager = ConfigManager()
         self.cooldown_files: Dict[str, float] = {}
+        self._pending_operations: List[Tuple[str, str, str, str, Optional[str]]] = []
         self.is_running = True
         self.observer = Observer()
+        self._stop_requested = threading.Event()
+        self._stopped = threading.Event()
         
         # Initialize statistics from database
         self.files_organized_today = statistics_db.get_today_stats()
         self.files_organized_total = statistics_db.get_total_stats()
+        self._stats_date = date.today()
 
     def run(self):
         """Starts the file watching process."""
         self.logger.info("TidyCore Engine thread started.")
-        self.initial_scan()
-        
-        self.observer.schedule(self, str(self.target_folder), recursive=False)
-        self.observer.start()
-        signals.status_changed.emit(self.is_running)
-
         try:
-            while self.observer.is_alive():
-                if self.is_running:
-                    self._process_cooldown_files()
-                time.sleep(1)
-        except Exception as e:
-            self.logger.critical(f"An error occurred in the engine loop: {e}", exc_info=True)
+            self.initial_scan()
+            
+            self.observer.schedule(self, str(self.target_folder), recursive=False)
+            self.observer.start()
+            signals.status_changed.emit(self.is_running)
+
+            try:
+                while self.observer.is_alive():
+                    if self.is_running:
+                        self._process_cooldown_files()
+                    # Wakes immediately when stop() is called
+                    if self._stop_requested.wait(1):
+                        break
+            except Exception as e:
+                self.logger.critical(f"An error occurred in the engine loop: {e}", exc_info=True)
+            finally:
+                if self.observer.is_alive():
+                    self.observer.stop()
+                self.observer.join()
+                self._flush_operations()
+                self.logger.info("TidyCore Engine thread has stopped.")
         finally:
-            if self.observer.is_alive():
-                self.observer.stop()
-            self.observer.join()
-            self.logger.info("TidyCore Engine thread has stopped.")
+            self._stopped.set()
 
     def pause(self):
         """Pauses the file processing loop."""
@@ -74,9 +95,14 @@ class TidyCoreEngine(FileSystemEventHandler):
     def stop(self):
         """Stops the observer thread gracefully."""
         self.logger.info("Engine stop signal received.")
+        self._stop_requested.set()
         if self.observer.is_alive():
             self.observer.stop()
 
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the engine thread has shut down. Returns False on timeout."""
+        return self._stopped.wait(timeout)
+
     def request_status(self):
         """Allows the GUI to request the current status upon startup."""
         self.logger.debug("GUI requested status update.")
@@ -92,6 +118,7 @@ class TidyCoreEngine(FileSystemEventHandler):
         
         for path in entries_to_process:
             self._organize_item(path)
+        self._flush_operations()
             
         self.logger.info("Initial scan complete.")
     
@@ -120,6 +147,7 @@ class TidyCoreEngine(FileSystemEventHandler):
                 del self.cooldown_files[path]
             if os.path.exists(path):
                 self._organize_item(path)
+        self._flush_operations()
 
     def _should_process(self, path: str) -> bool:
         base_name = os.path.basename(path)
@@ -180,21 +208,12 @@ class TidyCoreEngine(FileSystemEventHandler):
             self.logger.info(log_msg)
             signals.log_message.emit(log_msg)
             
-            # Record in database
-            statistics_db.record_file_operation(
-                filename=os.path.basename(path),
-                source_path=str(path),
-                destination_path=str(destination_path),
-                category=category,
-                subcategory=sub_category
-            )
-            
-            # Update in-memory counters from database
-            self.files_organized_today = statistics_db.get_today_stats()
-            self.files_organized_total = statistics_db.get_total_stats()
-            signals.update_stats.emit(self.files_organized_today, self.files_organized_total)
-            
-            signals.file_organized.emit(category)
+            # Record in database with the rest of this batch
+            self._pending_operations.append((
+                os.path.basename(path), str(path), str(destination_path), category, sub_category
+            ))
+            if len(self._pending_operations) >= OPERATION_BATCH_SIZE:
+                self._flush_operations()
 
             if os.path.isdir(destination_path):
                 signals.folder_decision_made.emit(original_path_str, str(destination_path), category)
@@ -204,6 +223,26 @@ class TidyCoreEngine(FileSystemEventHandler):
             self.logger.error(log_msg)
             signals.log_message.emit(f"[ERROR] {log_msg}")
 
+    def _flush_operations(self):
+        """Hands the buffered moves to the database as one batch and updates the stats."""
+        if not self._pending_operations:
+            return
+        operations, self._pending_operations = self._pending_operations, []
+        statistics_db.record_file_operations(operations)
+        
+        # Update in-memory counters directly; reading them back from the
+        # database would wait for the background write to finish
+        today = date.today()
+        if today != self._stats_date:
+            self.files_organized_today = 0
+            self._stats_date = today
+        self.files_organized_today += len(operations)
+        self.files_organized_total += len(operations)
+        signals.update_stats.emit(self.files_organized_today, self.files_organized_total)
+        
+        for operation in operations:
+            signals.file_organized.emit(operation[3])
+
     def undo_move(self, source_path: str, original_path: str):
         """Moves an item back from its organized location."""
         if not os.path.exists(source_path):
@@ -255,26 +294,36 @@ class TidyCoreEngine(FileSystemEventHandler):
             return "Others", None
 
         if os.path.isfile(path):
-            ext = os.path.splitext(path)[1].lower()
-            if not ext: return "Others", None
-            
-            for category, sub_rules in self.rules.items():
-                if isinstance(sub_rules, list): # Simple flat category
-                    if ext in sub_rules:
-                        return category, None
-                elif isinstance(sub_rules, dict): # Nested or mixed category
-                    # Check for flat extensions first using our special key
-                    if ext in sub_rules.get("__extensions__", []):
-                        return category, None
-                    
-                    # Then check the actual sub-categories
-                    for sub_category, extensions in sub_rules.items():
-                        if sub_category == "__extensions__":
-                            continue # Already checked
-                        if ext in extensions:
-                            return category, sub_category
+            return self._get_file_category(path)
         
-        return "Others", None
+        return DEFAULT_CATEGORY
+
+    def _get_file_category(self, path: str) -> Tuple[str, Optional[str]]:
+        """Looks up a file's category from its extension alone, without touching the disk."""
+        ext = os.path.splitext(path)[1].lower()
+        return self.extension_index.get(ext, DEFAULT_CATEGORY) if ext else DEFAULT_CATEGORY
+
+    @staticmethod
+    def _build_extension_index(rules: Dict[str, Any]) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Inverts the rules into an extension -> (category, sub-category) lookup.
+        Matches the rule precedence: categories in order, and within a nested
+        category its flat "__extensions__" before the sub-categories.
+        """
+        index: Dict[str, Tuple[str, Optional[str]]] = {}
+        for category, sub_rules in rules.items():
+            if isinstance(sub_rules, list): # Simple flat category
+                for ext in sub_rules:
+                    index.setdefault(ext, (category, None))
+            elif isinstance(sub_rules, dict): # Nested or mixed category
+                for ext in sub_rules.get("__extensions__", []):
+                    index.setdefault(ext, (category, None))
+                for sub_category, extensions in sub_rules.items():
+                    if sub_category == "__extensions__":
+                        continue # Already indexed
+                    for ext in extensions:
+                        index.setdefault(ext, (category, sub_category))
+        return index
 
     def _get_folder_dominant_category(self, folder_path: str) -> str:
         category_counts: Dict[str, int] = {category: 0 for category in self.rules.keys()}
@@ -282,7 +331,8 @@ class TidyCoreEngine(FileSystemEventHandler):
         try:
             for root, _, files in os.walk(folder_path):
                 for file in files:
-                    category, _ = self._get_category(os.path.join(root, file))
+                    # os.walk already knows these are files, so skip the stat calls
+                    category, _ = self._get_file_category(file)
                     if category in category_counts:
                         category_counts[category] += 1
         except Exception as e:
@@ -1,71 +1,134 @@
 # tidycore/folder_decision_widget.py
 import os
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMenu
+from PySide6.QtCore import Qt, QTimer
 
 class FolderDecisionWidget(QWidget):
     """A widget representing a single folder move decision."""
+
+    # Applied to the parent container so every card shares one parsed stylesheet
+    STYLESHEET = """
+        #DecisionCard {
+            background-color: rgba(58, 62, 102, 0.85);
+            border-radius: 12px;
+            margin-bottom: 12px;
+            border: 1.5px solid #7aa2f7;
+        }
+        #DecisionCard QLabel { font-size: 13px; color: #c0c5ea; }
+        #DecisionCard QPushButton { 
+            font-size: 12px; 
+            padding: 6px 14px; 
+            font-weight: 500;
+            background-color: #7aa2f7;
+            color: #23243a;
+            border-radius: 8px;
+            border: none;
+            margin-left: 6px;
+            margin-right: 6px;
+        }
+        #DecisionCard QPushButton:hover { background-color: #bb9af7; color: #fff; }
+    """
+
+    # Dismissed cards kept for reuse, so a burst of decisions doesn't rebuild
+    # the label/button tree every time. Beyond POOL_SIZE they are deleted.
+    POOL_SIZE = 8
+    DISMISS_DELAY_MS = 3000  # How long the "Undone"/"Will be ignored" state stays visible
+    _pool = []
+
+    @classmethod
+    def obtain(cls, engine, original_path, new_path, category, parent=None):
+        """Return a pooled card rebound to this decision, or a new one.
+
+        Pooled cards were hidden on dismissal; call show() once the card is
+        back in a layout.
+        """
+        if not cls._pool:
+            return cls(engine, original_path, new_path, category, parent)
+        widget = cls._pool.pop()
+        widget.setParent(parent)
+        widget._bind(engine, original_path, new_path, category)
+        return widget
+
     def __init__(self, engine, original_path, new_path, category, parent=None):
         super().__init__(parent)
-        self.engine = engine
-        self.original_path = original_path
-        self.new_path = new_path
-        self.folder_name = os.path.basename(original_path)
 
-        # Main container styling
+        # Main container styling. The QSS itself is set once on the container
+        # holding the cards (see STYLESHEET), not parsed again for every card.
         self.setObjectName("DecisionCard")
-        self.setStyleSheet("""
-            #DecisionCard {
-                background-color: rgba(58, 62, 102, 0.85);
-                border-radius: 12px;
-                margin-bottom: 12px;
-                border: 1.5px solid #7aa2f7;
-            }
-            #DecisionCard QLabel { font-size: 13px; color: #c0c5ea; }
-            #DecisionCard QPushButton { 
-                font-size: 12px; 
-                padding: 6px 14px; 
-                font-weight: 500;
-                background-color: #7aa2f7;
-                color: #23243a;
-                border-radius: 8px;
-                border: none;
-                margin-left: 6px;
-                margin-right: 6px;
-            }
-            #DecisionCard QPushButton:hover { background-color: #bb9af7; color: #fff; }
-        """)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 8, 10, 8)
 
-        info_text = f"Folder <b>'{self.folder_name}'</b> was categorized as <b>{category}</b>."
-        info_label = QLabel(info_text)
+        self.info_label = QLabel()
         
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        self.undo_button = QPushButton("Undo Move")
-        self.ignore_button = QPushButton("Always Ignore This Folder")
-        
-        self.undo_button.clicked.connect(self._undo_action)
-        self.ignore_button.clicked.connect(self._ignore_action)
+        # One button with a drop-down of both choices keeps each card's widget
+        # tree small when many decisions are listed at once
+        self.action_button = QPushButton()
+        action_menu = QMenu(self.action_button)
+        action_menu.addAction("Undo Move", self._undo_action)
+        action_menu.addAction("Always Ignore This Folder", self._ignore_action)
+        self.action_button.setMenu(action_menu)
 
-        button_layout.addWidget(self.undo_button)
-        button_layout.addWidget(self.ignore_button)
+        button_layout.addWidget(self.action_button)
 
-        main_layout.addWidget(info_label)
+        main_layout.addWidget(self.info_label)
         main_layout.addLayout(button_layout)
 
+        self._bind(engine, original_path, new_path, category)
+
+    def _bind(self, engine, original_path, new_path, category):
+        """Point the card at a decision and reset its buttons."""
+        self._decision_id = getattr(self, "_decision_id", 0) + 1
+        self.engine = engine
+        self.original_path = original_path
+        self.new_path = new_path
+        # rpartition is a single C call; Windows paths may also use the alternate separator
+        folder_name = original_path.rpartition(os.sep)[2]
+        if os.altsep:
+            folder_name = folder_name.rpartition(os.altsep)[2]
+        self.folder_name = folder_name or original_path
+
+        self.info_label.setText(
+            f"Folder <b>'{self.folder_name}'</b> was categorized as <b>{category}</b>."
+        )
+        self.action_button.setText("Undo or Ignore...")
+        self.action_button.setEnabled(True)
+
+    def dismiss(self):
+        """Take the card out of its list and return it to the pool (or delete it)."""
+        if self in FolderDecisionWidget._pool:
+            return
+        parent = self.parentWidget()
+        if parent is not None and parent.layout() is not None:
+            parent.layout().removeWidget(self)
+        self.hide()
+        if len(FolderDecisionWidget._pool) < self.POOL_SIZE:
+            self.setParent(None)
+            FolderDecisionWidget._pool.append(self)
+        else:
+            self.deleteLater()
+
     def _undo_action(self):
         # The destination for the undo is the original path
         self.engine.undo_move(self.new_path, self.original_path)
-        self.undo_button.setEnabled(False)
-        self.undo_button.setText("Undone")
-        self.ignore_button.hide()
+        self._show_result("Undone")
 
     def _ignore_action(self):
         self.engine.add_to_ignore_list(self.folder_name)
-        self.ignore_button.setEnabled(False)
-        self.ignore_button.setText("Will be ignored")
-        self.undo_button.hide()
\ No newline at end of file
+        self._show_result("Will be ignored")
+
+    def _show_result(self, text):
+        """Show the outcome on the (now disabled) button, then dismiss the card."""
+        self.action_button.setEnabled(False)
+        self.action_button.setText(text)
+        # The card may have been dismissed and reused for another decision by then
+        decision_id = self._decision_id
+        # With self as the context object, Qt drops the timer if the card is destroyed
+        QTimer.singleShot(
+            self.DISMISS_DELAY_MS, self,
+            lambda: decision_id == self._decision_id and self.dismiss()
+        )
\ No newline at end of file
@@ -2,6 +2,11 @@
 import sys
 import os
 import logging
+import time
+import heapq
+import functools
+from collections import deque
+from datetime import date, datetime
 import qtawesome as qta
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
@@ -9,12 +14,11 @@ from PySide6.QtWidgets import (
     QButtonGroup, QSystemTrayIcon, QMenu, QGridLayout, QScrollArea,
     QGraphicsDropShadowEffect, QProgressBar, QFrame
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon, QAction, QColor, QFont
+from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtGui import QIcon, QAction, QColor, QFont, QTextCursor
 
 from .signals import signals
 from .pie_chart_widget import PieChartWidget
-from .folder_decision_widget import FolderDecisionWidget
 from .settings_page import SettingsPage
 # --- NEW: Import the AboutPage ---
 from .about_page import AboutPage
@@ -30,6 +34,119 @@ except ImportError as e:
     logging.getLogger("TidyCore").warning(f"Failed to import update_manager: {e}")
     update_manager = None
 from .update_dialog import UpdateDialog, UpdateNotificationWidget
+
+# Icons are rendered/decoded once per process and shared by every window
+_ICON_CACHE = {}
+_APP_ICON = None
+_FALLBACK_TRAY_ICON_KEY = "system:desktop"  # Used when icon.png is missing
+
+
+def _icon(name: str) -> QIcon:
+    """Return the (cached) QtAwesome icon for name."""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = qta.icon(name)
+    return icon
+
+
+@functools.lru_cache(maxsize=None)
+def _icon_path_and_exists():
+    """Locate icon.png and check for it once per process."""
+    icon_path = get_absolute_path("icon.png")
+    return icon_path, os.path.exists(icon_path)
+
+
+def _app_icon():
+    """Return the (cached) application icon from icon.png, or None if the file is missing."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path, exists = _icon_path_and_exists()
+        if not exists:
+            return None
+        _APP_ICON = QIcon(icon_path)
+    return _APP_ICON
+
+
+# Activity feed colors and icons per message type, and the line template
+_LOG_STYLES = {
+    "error": ("#f7768e", "❌"),        # Red for errors
+    "warning": ("#e0af68", "⚠️"),      # Yellow for warnings
+    "success": ("#9ece6a", "✅"),      # Green for success
+    "processing": ("#7aa2f7", "🔄"),   # Blue for processing
+    "info": ("#a9b1d6", "ℹ️"),         # Default color
+}
+_LOG_TEMPLATE = '<span style="color: #545c7e;">[{timestamp}]</span> <span style="color: {color};">{icon} {message}</span>'
+
+
+def _classify_log_message(message: str) -> str:
+    """Return the _LOG_STYLES key for a log message (one upper-casing per message)."""
+    upper = message.upper()
+    if "ERROR" in upper or "FAILED" in upper:
+        return "error"
+    if "WARNING" in upper:
+        return "warning"
+    if "MOVED" in upper or "ORGANIZED" in upper:
+        return "success"
+    if "PROCESSING" in upper or "SCANNING" in upper:
+        return "processing"
+    return "info"
+
+
+# Widget stylesheets, each parsed once when its widget is built
+_ACTIVITY_FEED_QSS = """
+    QTextEdit {
+        background-color: #181926;
+        border: 1.5px solid #363a4f;
+        border-radius: 16px;
+        color: #a9b1d6;
+        font-size: 14px;
+        padding: 16px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        line-height: 1.4;
+    }
+"""
+
+_CLEAR_BUTTON_QSS = """
+    QPushButton {
+        background: #414868;
+        color: #a9b1d6;
+        border: 1px solid #545c7e;
+        font-size: 13px;
+        padding: 6px 16px;
+        margin: 4px 0;
+    }
+    QPushButton:hover {
+        background: #545c7e;
+        color: #ffffff;
+    }
+"""
+
+# Set on the legend container and shared by every legend row; only the
+# color swatch and progress fill carry their own (per-color) stylesheet
+_LEGEND_QSS = """
+    #LegendItem, #LegendItem QWidget {
+        background-color: rgba(26,27,38,0.8);
+        border-radius: 8px;
+        padding: 8px;
+        margin: 2px 0;
+    }
+    #LegendItem:hover, #LegendItem QWidget:hover {
+        background-color: rgba(35,36,58,0.9);
+    }
+    #LegendItem QLabel#LegendName { font-size: 14px; font-weight: 600; color: #c0c5ea; margin: 0; }
+    #LegendItem QLabel#LegendStats { font-size: 12px; color: #9aa5ce; margin: 0; }
+    #LegendItem QWidget#LegendTrack {
+        background-color: rgba(35,36,58,0.5);
+        border-radius: 2px;
+    }
+"""
+
+
+# Status label color per engine state, swapped on the label alone
+_STATUS_ACTIVE_QSS = "color: #9ece6a;"
+_STATUS_PAUSED_QSS = "color: #f7768e;"
+
+
 STYLESHEET = """
 /* ---- Main Window ---- */
 #MainWindow {
@@ -105,6 +222,7 @@ QGroupBox {
     background-color: rgba(35,36,58,0.96);
     border-radius: 24px;
     border: 1.5px solid #363a4f;
+    border-bottom: 3px solid rgba(60,70,120,110); /* Stands in for the card drop shadow */
     margin-top: 26px;
     padding-top: 26px;
     font-size: 18px;
@@ -130,9 +248,7 @@ QLabel#StatusLabel {
     color: #9ece6a;
     letter-spacing: 1px;
 }
-QLabel#StatusLabel[paused="true"] {
-    color: #f7768e;
-}
+/* The Active/Paused color is set on the label itself (see _STATUS_*_QSS) */
 QTextEdit {
     background-color: #181926;
     border: 1.5px solid #363a4f;
@@ -150,6 +266,10 @@ QTextEdit {
 class TidyCoreGUI(QMainWindow):
     """The main GUI window for TidyCore, featuring a sidebar and content area."""
 
+    ENABLE_CARD_SHADOWS = False
+    MAX_FOLDER_DECISIONS = 100  # Cards kept in the Recent Folder Decisions list
+    ACTIVITY_FEED_MAX_LINES = 500
+
     def __init__(self, engine, app: QApplication):
         super().__init__()
         self.engine = engine
@@ -158,6 +278,8 @@ class TidyCoreGUI(QMainWindow):
 
         # --- GUI OWNS ALL DISPLAY DATA ---
         self.category_counts = {}
+        self._last_drawn_counts = None  # Snapshot of the counts the chart/legend show
+        self._legend_rows = []  # Legend row widgets, created once and reused by every redraw
         self.chart_colors = [
             QColor("#7aa2f7"), QColor("#ff79c6"), QColor("#9ece6a"),
             QColor("#e0af68"), QColor("#bb9af7"), QColor("#7dcfff")
@@ -168,6 +290,32 @@ class TidyCoreGUI(QMainWindow):
         self.chart_update_timer.setSingleShot(True)
         self.chart_update_timer.setInterval(250) # Refresh 250ms after the last event
         self.chart_update_timer.timeout.connect(self.redraw_dashboard_charts)
+        # A steady stream of events keeps restarting the timer, so the chart is
+        # also redrawn once its oldest pending change is this old
+        self.chart_max_latency = 1.0  # seconds
+        self._chart_pending_since = None
+
+        # Counts are kept in memory per organized file; the database is only
+        # re-read periodically, and the same timer notices the midnight rollover
+        self._today = date.today()
+        self.category_resync_timer = QTimer(self)
+        self.category_resync_timer.setInterval(30000)
+        self.category_resync_timer.timeout.connect(self._resync_category_counts)
+        self.category_resync_timer.start()
+
+        # Log lines, stats and folder decisions arriving in a burst are
+        # buffered and applied to the widgets together, once per flush
+        # Bounded like the feed itself, so a long-hidden window can't pile up lines
+        self._pending_logs = deque(maxlen=self.ACTIVITY_FEED_MAX_LINES)
+        self._pending_decisions = []
+        self._pending_stats = None
+        self.ui_flush_timer = QTimer(self)
+        self.ui_flush_timer.setSingleShot(True)
+        self.ui_flush_timer.setInterval(200)
+        self.ui_flush_timer.timeout.connect(self._flush_ui)
+
+        # While minimized or hidden to the tray, updates are only buffered
+        self._suspended = False
 
         # --- UPDATE NOTIFICATION WIDGET ---
         self.update_notification = None
@@ -180,9 +328,9 @@ class TidyCoreGUI(QMainWindow):
         self.setObjectName("MainWindow")
         
         # Set window icon
-        icon_path = get_absolute_path("icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = _app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         self.setStyleSheet(STYLESHEET)
 
@@ -200,15 +348,19 @@ class TidyCoreGUI(QMainWindow):
         central_widget.setLayout(main_layout)
         self.setCentralWidget(central_widget)
         
-        self._create_tray_icon()
+        # The tray icon and its menu are built once the event loop is running,
+        # after the window's first paint
+        QTimer.singleShot(0, self._create_tray_icon)
         self._connect_signals()
         
-        # --- NEW: Check for updates on startup (silent check) ---
-        QTimer.singleShot(2000, lambda: update_manager.check_for_updates(silent=True))
-        
-        # --- NEW: Connect update manager signals ---
-        update_manager.checker.update_available.connect(self.show_update_notification)
-        update_manager.checker.error_occurred.connect(self._on_update_error)
+        # The updater is optional (see the guarded import above)
+        if update_manager is not None:
+            # --- NEW: Check for updates on startup (silent check) ---
+            QTimer.singleShot(2000, lambda: update_manager.check_for_updates(silent=True))
+            
+            # --- NEW: Connect update manager signals ---
+            update_manager.checker.update_available.connect(self.show_update_notification)
+            update_manager.checker.error_occurred.connect(self._on_update_error)
         
         QTimer.singleShot(100, self.engine.request_status)
 
@@ -226,9 +378,9 @@ class TidyCoreGUI(QMainWindow):
         # Logo or avatar at the top
         logo_label = QLabel()
         logo_label.setObjectName("LogoLabel")
-        logo_path = get_absolute_path("icon.png")
-        if os.path.exists(logo_path):
-            logo_label.setPixmap(QIcon(logo_path).pixmap(64, 64))
+        app_icon = _app_icon()
+        if app_icon is not None:
+            logo_label.setPixmap(app_icon.pixmap(64, 64))
         else:
             logo_label.setText("🧹")
             logo_label.setStyleSheet("font-size: 40px; text-align: center; color: #7aa2f7;")
@@ -243,15 +395,15 @@ class TidyCoreGUI(QMainWindow):
 
         # Create navigation buttons
         self.dashboard_button = QPushButton("  Dashboard")
-        self.dashboard_button.setIcon(qta.icon("fa5s.home"))
+        self.dashboard_button.setIcon(_icon("fa5s.home"))
         self.dashboard_button.setCheckable(True)
 
         self.settings_button = QPushButton("  Settings")
-        self.settings_button.setIcon(qta.icon("fa5s.cog"))
+        self.settings_button.setIcon(_icon("fa5s.cog"))
         self.settings_button.setCheckable(True)
 
         self.about_button = QPushButton("  About")
-        self.about_button.setIcon(qta.icon("fa5s.info-circle"))
+        self.about_button.setIcon(_icon("fa5s.info-circle"))
         self.about_button.setCheckable(True)
 
         self.nav_button_group = QButtonGroup(self)
@@ -307,9 +459,9 @@ class TidyCoreGUI(QMainWindow):
         # Initialize indicators
         update_indicators()
 
-        self.dashboard_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
-        self.settings_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))
-        self.about_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(2))
+        self.dashboard_button.clicked.connect(lambda: self._show_page(0))
+        self.settings_button.clicked.connect(lambda: self._show_page(1))
+        self.about_button.clicked.connect(lambda: self._show_page(2))
 
         return sidebar_widget
 
@@ -324,17 +476,37 @@ class TidyCoreGUI(QMainWindow):
         content_layout.addWidget(self.stacked_widget)
         
         self.dashboard_page = self._create_dashboard_page()
-        self.settings_page = SettingsPage()
-        # --- NEW: Create an instance of the AboutPage ---
-        self.about_page = AboutPage()
+        # Settings and About are built the first time they are opened (see
+        # _show_page); until then an empty placeholder holds their index
+        self.settings_page = None
+        self.about_page = None
+        self._page_builders = {1: self._build_settings_page, 2: self._build_about_page}
         
         # Add all pages to the stacked widget in order
         self.stacked_widget.addWidget(self.dashboard_page)
-        self.stacked_widget.addWidget(self.settings_page)
-        self.stacked_widget.addWidget(self.about_page) # Add new page
+        self.stacked_widget.addWidget(QWidget())
+        self.stacked_widget.addWidget(QWidget())
         
         return content_widget
 
+    def _show_page(self, index: int):
+        """Switch to the page at index, building it on first use."""
+        build_page = self._page_builders.pop(index, None)
+        if build_page is not None:
+            placeholder = self.stacked_widget.widget(index)
+            self.stacked_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stacked_widget.insertWidget(index, build_page())
+        self.stacked_widget.setCurrentIndex(index)
+
+    def _build_settings_page(self) -> QWidget:
+        self.settings_page = SettingsPage()
+        return self.settings_page
+
+    def _build_about_page(self) -> QWidget:
+        self.about_page = AboutPage()
+        return self.about_page
+
 
     def _create_dashboard_page(self) -> QWidget:
         page = QWidget()
@@ -363,6 +535,14 @@ class TidyCoreGUI(QMainWindow):
         layout.setRowStretch(0, 2)    # Status row 
         layout.setRowStretch(1, 2)    # Stats row 
         layout.setRowStretch(2, 4)    # Activity feed is largest
+
+        # Minimum sizes in the same proportions, so the grid settles in one
+        # layout pass; they still fit the window's 1000x750 minimum size
+        layout.setColumnMinimumWidth(0, 380)
+        layout.setColumnMinimumWidth(1, 250)
+        layout.setRowMinimumHeight(0, 140)
+        layout.setRowMinimumHeight(1, 140)
+        layout.setRowMinimumHeight(2, 280)
         
         # Add spacing between grid items
         layout.setSpacing(20)
@@ -372,6 +552,11 @@ class TidyCoreGUI(QMainWindow):
 
 
     def _add_card_shadow(self, widget):
+        # A graphics effect renders the card offscreen and blurs it on the CPU
+        # on every repaint of anything inside it, so it is off by default;
+        # the QGroupBox border in STYLESHEET gives the cards their depth instead
+        if not self.ENABLE_CARD_SHADOWS:
+            return
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(36)
         shadow.setOffset(0, 10)
@@ -383,11 +568,14 @@ class TidyCoreGUI(QMainWindow):
         self._add_card_shadow(box)
         layout = QHBoxLayout(box)
         self.chart_widget = PieChartWidget()
-        self.legend_layout = QVBoxLayout()
+        legend_container = QWidget()
+        legend_container.setStyleSheet(_LEGEND_QSS)
+        self.legend_layout = QVBoxLayout(legend_container)
+        self.legend_layout.setContentsMargins(0, 0, 0, 0)
         self.legend_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
         self.legend_layout.setSpacing(10)
         layout.addWidget(self.chart_widget, 2)
-        layout.addLayout(self.legend_layout, 1)
+        layout.addWidget(legend_container, 1)
         return box
 
 
@@ -414,6 +602,7 @@ class TidyCoreGUI(QMainWindow):
         # Status text
         self.status_label = QLabel("Initializing...")
         self.status_label.setObjectName("StatusLabel")
+        self._shown_running = None  # Engine state the label shows; None until the first update
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         status_layout.addWidget(self.status_icon)
@@ -504,35 +693,13 @@ class TidyCoreGUI(QMainWindow):
         
         self.activity_feed = QTextEdit()
         self.activity_feed.setReadOnly(True)
-        self.activity_feed.setStyleSheet("""
-            QTextEdit {
-                background-color: #181926;
-                border: 1.5px solid #363a4f;
-                border-radius: 16px;
-                color: #a9b1d6;
-                font-size: 14px;
-                padding: 16px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                line-height: 1.4;
-            }
-        """)
+        # Keep a rolling window of log lines; Qt drops the oldest blocks itself
+        self.activity_feed.document().setMaximumBlockCount(self.ACTIVITY_FEED_MAX_LINES)
+        self.activity_feed.setStyleSheet(_ACTIVITY_FEED_QSS)
         
         # Add a clear button
         clear_button = QPushButton("Clear Feed")
-        clear_button.setStyleSheet("""
-            QPushButton {
-                background: #414868;
-                color: #a9b1d6;
-                border: 1px solid #545c7e;
-                font-size: 13px;
-                padding: 6px 16px;
-                margin: 4px 0;
-            }
-            QPushButton:hover {
-                background: #545c7e;
-                color: #ffffff;
-            }
-        """)
+        clear_button.setStyleSheet(_CLEAR_BUTTON_QSS)
         clear_button.clicked.connect(self.activity_feed.clear)
         
         layout.addWidget(self.activity_feed)
@@ -563,111 +730,194 @@ class TidyCoreGUI(QMainWindow):
 
 
     def add_log_message(self, message: str):
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
-        
         # Color code different message types
-        if "ERROR" in message.upper() or "FAILED" in message.upper():
-            color = "#f7768e"  # Red for errors
-            icon = "❌"
-        elif "WARNING" in message.upper():
-            color = "#e0af68"  # Yellow for warnings
-            icon = "⚠️"
-        elif "MOVED" in message.upper() or "ORGANIZED" in message.upper():
-            color = "#9ece6a"  # Green for success
-            icon = "✅"
-        elif "PROCESSING" in message.upper() or "SCANNING" in message.upper():
-            color = "#7aa2f7"  # Blue for processing
-            icon = "🔄"
-        else:
-            color = "#a9b1d6"  # Default color
-            icon = "ℹ️"
-        
-        formatted_message = f'<span style="color: #545c7e;">[{timestamp}]</span> <span style="color: {color};">{icon} {message}</span>'
-        self.activity_feed.append(formatted_message)
-        
-        # Auto-scroll to bottom
-        scrollbar = self.activity_feed.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        color, icon = _LOG_STYLES[_classify_log_message(message)]
+        self._pending_logs.append(
+            _LOG_TEMPLATE.format(timestamp=timestamp, color=color, icon=icon, message=message)
+        )
+        self._schedule_ui_flush()
 
     def update_statistics(self, today_count: int, total_count: int):
-        self.today_number.setText(str(today_count))
-        self.total_number.setText(str(total_count))
+        self._pending_stats = (today_count, total_count)  # Only the latest counts are shown
+        self._schedule_ui_flush()
+
+    def _schedule_ui_flush(self):
+        if not self._suspended and not self.ui_flush_timer.isActive():
+            self.ui_flush_timer.start()
+
+    def _flush_ui(self):
+        """Apply everything buffered since the last flush in one pass."""
+        if self._pending_logs:
+            # One block per line so the block cap trims whole log lines. The
+            # edit block makes Qt lay out and signal the change once per flush.
+            document = self.activity_feed.document()
+            needs_new_block = not document.isEmpty()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            for formatted_message in self._pending_logs:
+                if needs_new_block:
+                    cursor.insertBlock()
+                cursor.insertHtml(formatted_message)
+                needs_new_block = True
+            cursor.endEditBlock()
+            self._pending_logs.clear()
+            # Auto-scroll to bottom
+            scrollbar = self.activity_feed.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+
+        if self._pending_stats is not None:
+            today_count, total_count = self._pending_stats
+            self._pending_stats = None
+            self.today_number.setText(str(today_count))
+            self.total_number.setText(str(total_count))
+
+        if self._pending_decisions:
+            container = self.folder_decisions_layout.parentWidget()
+            container.setUpdatesEnabled(False)
+            try:
+                for decision in self._pending_decisions:
+                    self._insert_folder_decision(*decision)
+                # Keep the list (and its relayout cost) bounded; oldest cards go first
+                while self.folder_decisions_layout.count() > self.MAX_FOLDER_DECISIONS:
+                    item = self.folder_decisions_layout.itemAt(self.MAX_FOLDER_DECISIONS)
+                    item.widget().dismiss()
+            finally:
+                self._pending_decisions.clear()
+                container.setUpdatesEnabled(True)
 
     def update_status(self, is_running: bool):
         """Updates the status label AND the pause/resume button text."""
+        if is_running == self._shown_running:
+            return
+        self._shown_running = is_running
+
         if is_running:
             self.status_label.setText("Active")
-            self.status_label.setProperty("paused", "false")
+            self.status_label.setStyleSheet(_STATUS_ACTIVE_QSS)
             self.status_icon.setText("✅")
             self.pause_resume_button.setText("⏸️ Pause Watching")
         else:
             self.status_label.setText("Paused")
-            self.status_label.setProperty("paused", "true")
+            self.status_label.setStyleSheet(_STATUS_PAUSED_QSS)
             self.status_icon.setText("⏸️")
             self.pause_resume_button.setText("▶️ Resume Watching")
-            
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
 
     def on_file_organized(self, category_name: str):
-        # Refresh category data from database
+        self.category_counts[category_name] = self.category_counts.get(category_name, 0) + 1
+        if self._suspended:
+            return  # Drawn when the window is shown again
+        now = time.monotonic()
+        if self._chart_pending_since is None:
+            self._chart_pending_since = now
+        elif now - self._chart_pending_since > self.chart_max_latency:
+            self.chart_update_timer.stop()
+            self.redraw_dashboard_charts()
+            return
+        self.chart_update_timer.start()
+
+    def _resync_category_counts(self):
+        """Replace the in-memory category counts with today's counts from the database."""
+        today = date.today()
+        if today != self._today:
+            # New day: nothing organized yesterday belongs in today's figure.
+            # The total is left alone, and so are buffered engine updates,
+            # which may already be counting the new day.
+            self._today = today
+            self.today_number.setText(str(statistics_db.get_today_stats()))
         self.category_counts = statistics_db.get_category_stats_today()
         self.chart_update_timer.start()
         
     def add_folder_decision(self, original_path: str, new_path: str, category: str):
-        decision_widget = FolderDecisionWidget(self.engine, original_path, new_path, category)
+        self._pending_decisions.append((original_path, new_path, category))
+        self._schedule_ui_flush()
+
+    def _insert_folder_decision(self, original_path: str, new_path: str, category: str):
+        # Most sessions never move a folder, so the card module is loaded on first use
+        from .folder_decision_widget import FolderDecisionWidget
+        container = self.folder_decisions_layout.parentWidget()
+        if not container.styleSheet():
+            container.setStyleSheet(FolderDecisionWidget.STYLESHEET)  # Shared by every decision card
+        decision_widget = FolderDecisionWidget.obtain(self.engine, original_path, new_path, category)
         self.folder_decisions_layout.insertWidget(0, decision_widget)
+        decision_widget.show()  # Reused cards come back hidden
 
     def redraw_dashboard_charts(self):
+        self._chart_pending_since = None
+        # Nothing to do if the counts haven't changed since the last redraw
+        drawn_counts = tuple(sorted(self.category_counts.items()))
+        if drawn_counts == self._last_drawn_counts:
+            return
+        self._last_drawn_counts = drawn_counts
+
         if not self.category_counts:
             self.chart_widget.update_slices([])
+            self._update_legend([], 0)
             return
 
         total = sum(self.category_counts.values())
         if total == 0:
             self.chart_widget.update_slices([])
+            self._update_legend([], 0)
             return
             
-        sorted_data = dict(sorted(self.category_counts.items(), key=lambda item: item[1], reverse=True))
+        # One slice per palette color: the largest categories, with the rest
+        # folded into a final bucket once they no longer fit
+        palette_size = len(self.chart_colors)
+        if len(self.category_counts) <= palette_size:
+            chart_items = sorted(self.category_counts.items(), key=lambda item: item[1], reverse=True)
+        else:
+            chart_items = heapq.nlargest(palette_size - 1, self.category_counts.items(), key=lambda item: item[1])
+            chart_items.append(("Other categories", total - sum(count for _, count in chart_items)))
         
         slices_to_draw = []
         start_angle = 90.0
 
-        for i, (category, count) in enumerate(sorted_data.items()):
+        for i, (category, count) in enumerate(chart_items):
             span_angle = (count / total) * 360.0
             color = self.chart_colors[i % len(self.chart_colors)]
             slices_to_draw.append({'color': color, 'start_angle': start_angle, 'span_angle': -span_angle})
             start_angle -= span_angle
         
         self.chart_widget.update_slices(slices_to_draw)
-        
-        while self.legend_layout.count():
-            child = self.legend_layout.takeAt(0)
-            if child.widget(): child.widget().deleteLater()
-            elif child.layout():
-                while child.layout().count():
-                    nested_child = child.layout().takeAt(0)
-                    if nested_child.widget(): nested_child.widget().deleteLater()
-        
-        for i, (category, count) in enumerate(sorted_data.items()):
-            color = self.chart_colors[i % len(self.chart_colors)]
-            self._add_legend_item(category, count, total, color)
-            
-    def _add_legend_item(self, name, value, total, color):
-        # Create a container widget for better styling
+        self._update_legend(chart_items, total)
+
+    def _update_legend(self, items, total):
+        """Show one legend row per (category, count), reusing rows from earlier redraws."""
+        while len(self._legend_rows) < len(items):
+            self._legend_rows.append(self._create_legend_row())
+
+        for i, row in enumerate(self._legend_rows):
+            if i >= len(items):
+                row['container'].hide()
+                continue
+
+            name, value = items[i]
+            color = self.chart_colors[i % len(self.chart_colors)].name()
+            percentage = (value / total) * 100
+            row['category_label'].setText(name)
+            row['stats_label'].setText(f"{value} files ({percentage:.1f}%)")
+            row['progress_bar'].setFixedWidth(int((percentage / 100) * 60))  # Max width of 60px
+            # Only the color-dependent styles are re-applied, and only when the color changes
+            if row['color'] != color:
+                row['color'] = color
+                row['color_box'].setStyleSheet(f"""
+                    background-color: {color};
+                    border-radius: 8px;
+                    border: 2px solid rgba(255,255,255,0.1);
+                """)
+                row['progress_bar'].setStyleSheet(f"""
+                    background-color: {color};
+                    border-radius: 2px;
+                """)
+            row['container'].show()
+
+    def _create_legend_row(self) -> dict:
+        """Build an empty legend row; _update_legend fills in its text and color."""
+        # Create a container widget for better styling (see _LEGEND_QSS)
         item_widget = QWidget()
-        item_widget.setStyleSheet("""
-            QWidget {
-                background-color: rgba(26,27,38,0.8);
-                border-radius: 8px;
-                padding: 8px;
-                margin: 2px 0;
-            }
-            QWidget:hover {
-                background-color: rgba(35,36,58,0.9);
-            }
-        """)
+        item_widget.setObjectName("LegendItem")
         
         legend_item_layout = QHBoxLayout(item_widget)
         legend_item_layout.setContentsMargins(8, 6, 8, 6)
@@ -676,11 +926,6 @@ class TidyCoreGUI(QMainWindow):
         # Color indicator - make it larger and more prominent
         color_box = QLabel()
         color_box.setFixedSize(16, 16)
-        color_box.setStyleSheet(f"""
-            background-color: {color.name()};
-            border-radius: 8px;
-            border: 2px solid rgba(255,255,255,0.1);
-        """)
         
         # Text container for category info
         text_container = QVBoxLayout()
@@ -688,14 +933,12 @@ class TidyCoreGUI(QMainWindow):
         text_container.setContentsMargins(0, 0, 0, 0)
         
         # Category name
-        category_label = QLabel(name)
-        category_label.setStyleSheet("font-size: 14px; font-weight: 600; color: #c0c5ea; margin: 0;")
+        category_label = QLabel()
+        category_label.setObjectName("LegendName")
         
         # Statistics
-        percentage = (value / total) * 100
-        stats_text = f"{value} files ({percentage:.1f}%)"
-        stats_label = QLabel(stats_text)
-        stats_label.setStyleSheet("font-size: 12px; color: #9aa5ce; margin: 0;")
+        stats_label = QLabel()
+        stats_label.setObjectName("LegendStats")
         
         text_container.addWidget(category_label)
         text_container.addWidget(stats_label)
@@ -703,24 +946,24 @@ class TidyCoreGUI(QMainWindow):
         # Progress bar for visual percentage
         progress_container = QWidget()
         progress_container.setFixedHeight(4)
-        progress_container.setStyleSheet(f"""
-            background-color: rgba(35,36,58,0.5);
-            border-radius: 2px;
-        """)
+        progress_container.setObjectName("LegendTrack")
         
         progress_bar = QWidget(progress_container)
-        progress_width = int((percentage / 100) * 60)  # Max width of 60px
-        progress_bar.setFixedSize(progress_width, 4)
-        progress_bar.setStyleSheet(f"""
-            background-color: {color.name()};
-            border-radius: 2px;
-        """)
+        progress_bar.setFixedHeight(4)
         
         legend_item_layout.addWidget(color_box)
         legend_item_layout.addLayout(text_container, 1)
         legend_item_layout.addWidget(progress_container)
         
         self.legend_layout.addWidget(item_widget)
+        return {
+            'container': item_widget,
+            'color_box': color_box,
+            'category_label': category_label,
+            'stats_label': stats_label,
+            'progress_bar': progress_bar,
+            'color': None,
+        }
 
     def show_update_notification(self, update_info):
         """Show update notification using the modern dialog."""
@@ -742,6 +985,9 @@ class TidyCoreGUI(QMainWindow):
         try:
             dialog = UpdateDialog(update_info, self)
             dialog.download_requested.connect(self._handle_update_download)
+            # Kept for _handle_update_download, which is only reached from this dialog
+            self._current_update_dialog = dialog
+            dialog.finished.connect(lambda: setattr(self, '_current_update_dialog', None))
             dialog.exec()
         except Exception as e:
             self.logger.error(f"Failed to show update dialog: {e}")
@@ -749,16 +995,8 @@ class TidyCoreGUI(QMainWindow):
     def _handle_update_download(self, download_url):
         """Handle update download request."""
         try:
-            # Import UpdateDialog locally to avoid circular imports
-            from .update_dialog import UpdateDialog
-            from PySide6.QtWidgets import QApplication
-            
-            # Store reference to current dialog
-            current_dialog = None
-            for widget in QApplication.allWidgets():
-                if isinstance(widget, UpdateDialog) and widget.isVisible():
-                    current_dialog = widget
-                    break
+            # The dialog that requested the download (set in _show_update_dialog)
+            current_dialog = getattr(self, '_current_update_dialog', None)
             
             if current_dialog:
                 # Connect progress updates to the dialog
@@ -788,30 +1026,36 @@ class TidyCoreGUI(QMainWindow):
                               f"Failed to check for updates:\n{error_message}")
 
     def _create_tray_icon(self):
-        # --- MODIFIED: Use the absolute path for the icon ---
-        icon_path = get_absolute_path("icon.png")
+        # --- Shared application icon (decoded once per process) ---
+        icon = _app_icon()
         
-        if not os.path.exists(icon_path):
-            self.logger.warning(f"Icon file 'icon.png' not found in the project directory.")
-            self.logger.warning("Using a default system icon as a fallback. Please add 'icon.png' for a custom icon.")
-            icon = self.style().standardIcon(getattr(self.style(), 'SP_DesktopIcon'))
-        else:
-            icon = QIcon(icon_path)
+        if icon is None:
+            # The fallback is cached alongside the QtAwesome icons, so the
+            # warning is logged once per process too
+            icon = _ICON_CACHE.get(_FALLBACK_TRAY_ICON_KEY)
+            if icon is None:
+                self.logger.warning(f"Icon file 'icon.png' not found in the project directory.")
+                self.logger.warning("Using a default system icon as a fallback. Please add 'icon.png' for a custom icon.")
+                icon = self.style().standardIcon(getattr(self.style(), 'SP_DesktopIcon'))
+                _ICON_CACHE[_FALLBACK_TRAY_ICON_KEY] = icon
             
         self.tray_icon = QSystemTrayIcon(icon, self)
         self.tray_icon.setToolTip("TidyCore")
         
-        menu = QMenu()
+        # Parented to the window so it lives as long as the tray icon using it
+        menu = QMenu(self)
         show_action = QAction("Show Dashboard", self)
         update_action = QAction("Check for Updates", self)
         quit_action = QAction("Quit TidyCore", self)
 
         show_action.triggered.connect(self.show_window)
-        update_action.triggered.connect(lambda: update_manager.check_for_updates(silent=False))
+        if update_manager is not None:
+            update_action.triggered.connect(lambda: update_manager.check_for_updates(silent=False))
+        else:
+            update_action.setEnabled(False)
         quit_action.triggered.connect(self.app.quit)
 
-        menu.addAction(show_action)
-        menu.addAction(update_action)
+        menu.addActions([show_action, update_action])
         menu.addSeparator()
         menu.addAction(quit_action)
         
@@ -823,6 +1067,34 @@ class TidyCoreGUI(QMainWindow):
         self.activateWindow()
         self.raise_()
 
+    def _set_suspended(self, suspended: bool):
+        """Stop the dashboard timers while the window can't be seen, catch up when it can."""
+        if suspended == self._suspended:
+            return
+        self._suspended = suspended
+        if suspended:
+            self.chart_update_timer.stop()
+            self.category_resync_timer.stop()
+            self.ui_flush_timer.stop()
+        else:
+            self.category_resync_timer.start()
+            # Apply buffered updates first, so a new day found by the resync wins
+            self._flush_ui()
+            self._resync_category_counts()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._set_suspended(self.isMinimized() or not self.isVisible())
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._set_suspended(self.isMinimized())
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._set_suspended(True)
+
     def closeEvent(self, event):
         """Handle the window close event."""
         if hasattr(self, 'engine') and self.engine:
@@ -1,24 +1,39 @@
 # tidycore/logger.py
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from .utils import get_absolute_path # Import the new function
 
 LOG_FILE_PATH = get_absolute_path("tidycore.log") # Define the path
+LOG_MAX_BYTES = 10 * 1024 * 1024  # Rotate tidycore.log at 10 MB...
+LOG_BACKUP_COUNT = 10             # ...keeping tidycore.log.1 to .10
+
+# Writes the queued records to the console and log file on its own thread
+_listener = None
 
 def setup_logger() -> logging.Logger:
     """Sets up a standardized logger for the application."""
+    global _listener
     logger = logging.getLogger("TidyCore")
     logger.setLevel(logging.INFO)
 
     if logger.hasHandlers():
         logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
     # Create a handler for console output (stdout)
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setLevel(logging.INFO)
     
-    # Create a handler for writing to a log file
-    file_handler = logging.FileHandler(LOG_FILE_PATH, mode='a', encoding='utf-8')
+    # Create a handler for writing to a (size-capped) log file, opened on the first record
+    file_handler = RotatingFileHandler(
+        LOG_FILE_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+        encoding='utf-8', delay=True
+    )
     file_handler.setLevel(logging.INFO)
 
     formatter = logging.Formatter(
@@ -28,7 +43,17 @@ def setup_logger() -> logging.Logger:
     stream_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(stream_handler)
-    logger.addHandler(file_handler)
+    # Callers only enqueue records; the console and file writes happen on the
+    # listener's thread, which is drained and stopped at exit
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+
+    return logger
+
+def _stop_listener():
+    if _listener is not None:
+        _listener.stop()
 
-    return logger
\ No newline at end of file
+atexit.register(_stop_listener)
@@ -1,14 +1,14 @@
 # tidycore/settings_page.py
+import time
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QLineEdit, 
-    QPushButton, QListWidget, QListWidgetItem, QFileDialog, QMessageBox,
+    QPushButton, QListWidget, QListWidgetItem,
     QGroupBox, QRadioButton, QTreeWidget, QTreeWidgetItem, QMenu,
-    QInputDialog,
     # --- NEW: Add QCheckBox ---
     QCheckBox
 )
 from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from .config_manager import ConfigManager
 from .signals import signals
@@ -22,6 +22,29 @@ class SettingsPage(QWidget):
         self.config_manager = ConfigManager()
         self.current_config = {} # Will be populated by refresh_settings
         
+        # The controls, the config read and the rules tree are only built when
+        # the page is first shown (see _ensure_built)
+        self._built = False
+        self._config_signature = None  # Config file (mtime, size) the controls reflect
+
+        # config_changed can arrive in bursts (a save plus an engine write);
+        # the first one refreshes at once, the rest within the window are merged
+        self._last_refresh = 0.0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh_settings)
+
+    def showEvent(self, event):
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self):
+        """Build the UI and load the config on first use."""
+        if self._built:
+            return
+        self._built = True
+
         # Flag to prevent startup messages during initialization
         self._initializing = True
 
@@ -35,7 +58,16 @@ class SettingsPage(QWidget):
         self._initializing = False
 
         # Connect to the config changed signal to stay in sync
-        signals.config_changed.connect(self.refresh_settings)
+        signals.config_changed.connect(self._on_config_changed)
+
+    def _on_config_changed(self):
+        """Refresh now, or once the current 50 ms window ends if we just did."""
+        if self._refresh_timer.isActive():
+            return
+        if time.monotonic() - self._last_refresh >= self._refresh_timer.interval() / 1000:
+            self.refresh_settings()
+        else:
+            self._refresh_timer.start()
 
     def _build_ui(self):
         """Creates the static UI elements once."""
@@ -74,7 +106,13 @@ class SettingsPage(QWidget):
         """
         Loads the latest config from disk and populates all UI controls.
         """
+        self._last_refresh = time.monotonic()
+        # Nothing to do if the file is unchanged since we last loaded or saved it
+        signature = self.config_manager.get_signature()
+        if signature is not None and signature == self._config_signature:
+            return
         self.current_config = self.config_manager.load_config()
+        self._config_signature = signature
         
         # Populate target folder
         self.folder_path_edit.setText(self.current_config.get("target_folder", ""))
@@ -93,6 +131,7 @@ class SettingsPage(QWidget):
         ignore_items = self.current_config.get("ignore_list", [])
         for item in ignore_items:
             self.ignore_list_widget.addItem(QListWidgetItem(item))
+        self._ignore_set = set(ignore_items)
             
         # --- NEW: Populate the rules tree ---
         self._populate_rules_tree()
@@ -126,7 +165,9 @@ class SettingsPage(QWidget):
         
         return box
 
+    # Dialog classes are imported where they are used, as in gui.py
     def _browse_for_folder(self):
+        from PySide6.QtWidgets import QFileDialog
         folder_name = QFileDialog.getExistingDirectory(self, "Select Folder to Organize")
         if folder_name:
             self.folder_path_edit.setText(folder_name)
@@ -137,6 +178,7 @@ class SettingsPage(QWidget):
         if self._initializing:
             return
             
+        from PySide6.QtWidgets import QMessageBox
         try:
             if checked:
                 startup_manager.enable()
@@ -172,6 +214,8 @@ class SettingsPage(QWidget):
         # Enable the context menu
         self.rules_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.rules_tree.customContextMenuRequested.connect(self._open_rules_context_menu)
+        self._context_target = None
+        self._build_rules_context_menus()
 
         # --- NEW: A single button to add top-level categories ---
         add_category_btn = QPushButton("Add New Main Category...")
@@ -186,44 +230,49 @@ class SettingsPage(QWidget):
         
         return box
 
+    def _build_rules_context_menus(self):
+        """Creates the rules tree's three context menus once; see _open_rules_context_menu."""
+        # Right-clicked on an empty area
+        self._empty_area_menu = QMenu(self)
+        add_top_action = QAction("Add New Main Category...", self)
+        add_top_action.triggered.connect(self._add_top_level_category)
+        self._empty_area_menu.addAction(add_top_action)
+
+        # Categories (main or sub) can get children; every item can be removed
+        add_sub_cat_action = QAction("Add Sub-Category...", self)
+        add_sub_cat_action.triggered.connect(lambda: self._add_item(self._context_target, is_subcategory=True))
+        add_ext_action = QAction("Add Extension...", self)
+        add_ext_action.triggered.connect(lambda: self._add_item(self._context_target, is_extension=True))
+        remove_action = QAction("Remove Selected", self)
+        remove_action.triggered.connect(lambda: self._remove_item(self._context_target))
+
+        self._category_menu = QMenu(self)
+        self._category_menu.addActions([add_sub_cat_action, add_ext_action])
+        self._category_menu.addSeparator()
+        self._category_menu.addAction(remove_action)
+
+        # If it's an extension, the only option is to remove it.
+        self._extension_menu = QMenu(self)
+        self._extension_menu.addAction(remove_action)
+
     def _open_rules_context_menu(self, position):
-        menu = QMenu()
         selected_item = self.rules_tree.currentItem()
+        # The menus' actions act on this item
+        self._context_target = selected_item
 
         if not selected_item:
-            # Right-clicked on an empty area
-            add_top_action = QAction("Add New Main Category...", self)
-            add_top_action.triggered.connect(self._add_top_level_category)
-            menu.addAction(add_top_action)
+            menu = self._empty_area_menu
+        # A simple rule: if it starts with '.', it's an extension.
+        elif selected_item.text(0).startswith('.'):
+            menu = self._extension_menu
         else:
-            # Determine if the item is an extension or a category
-            # A simple rule: if it starts with '.', it's an extension.
-            is_extension = selected_item.text(0).startswith('.')
-
-            if is_extension:
-                # If it's an extension, the only option is to remove it.
-                pass # The remove action is added below for all items
-            else:
-                # If it's a category (main or sub), offer to add children to it.
-                add_sub_cat_action = QAction("Add Sub-Category...", self)
-                add_sub_cat_action.triggered.connect(lambda: self._add_item(selected_item, is_subcategory=True))
-                
-                add_ext_action = QAction("Add Extension...", self)
-                add_ext_action.triggered.connect(lambda: self._add_item(selected_item, is_extension=True))
-                
-                menu.addAction(add_sub_cat_action)
-                menu.addAction(add_ext_action)
-
-            # Add a remove action for any selected item
-            menu.addSeparator()
-            remove_action = QAction("Remove Selected", self)
-            remove_action.triggered.connect(lambda: self._remove_item(selected_item))
-            menu.addAction(remove_action)
+            menu = self._category_menu
 
         # Execute the menu at the cursor's position
         menu.exec(self.rules_tree.viewport().mapToGlobal(position))
 
     def _add_top_level_category(self):
+        from PySide6.QtWidgets import QInputDialog
         text, ok = QInputDialog.getText(self, "Add Main Category", "Enter name for the new category:")
         if ok and text:
             item = QTreeWidgetItem(self.rules_tree, [text])
@@ -237,6 +286,7 @@ class SettingsPage(QWidget):
         elif is_extension:
             title, prompt = "Add Extension", "Enter extension (e.g., '.txt'):"
 
+        from PySide6.QtWidgets import QInputDialog
         text, ok = QInputDialog.getText(self, title, prompt)
         if ok and text:
             # Ensure extensions start with a dot
@@ -258,33 +308,47 @@ class SettingsPage(QWidget):
 
     # --- NEW, ROBUST POPULATING LOGIC ---
     def _populate_rules_tree(self):
-        self.rules_tree.clear()
-        rules = self.current_config.get("rules", {})
-        
-        for category, sub_rules in rules.items():
-            category_item = QTreeWidgetItem(self.rules_tree, [category])
-            category_item.setFlags(category_item.flags() | Qt.ItemFlag.ItemIsEditable)
-
-            if isinstance(sub_rules, dict): # Nested categories
-                for sub_key, extensions in sub_rules.items():
-                    if sub_key == "__extensions__": # Our special key for flat extensions
-                        for ext in extensions:
-                            ext_item = QTreeWidgetItem(category_item, [ext])
-                    else: # A true sub-category
-                        sub_item = QTreeWidgetItem(category_item, [sub_key])
-                        sub_item.setFlags(sub_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                        for ext in extensions:
-                            ext_item = QTreeWidgetItem(sub_item, [ext])
-            elif isinstance(sub_rules, list): # Purely flat categories
-                for ext in sub_rules:
-                    ext_item = QTreeWidgetItem(category_item, [ext])
-        
-        self.rules_tree.expandAll()
+        # Items are built detached and added in bulk, with painting and signals
+        # held off until the whole tree is in place
+        self.rules_tree.setUpdatesEnabled(False)
+        self.rules_tree.blockSignals(True)
+        try:
+            self.rules_tree.clear()
+            rules = self.current_config.get("rules", {})
+            editable = Qt.ItemFlag.ItemIsEditable
+            category_items = []
+            
+            for category, sub_rules in rules.items():
+                category_item = QTreeWidgetItem([category])
+                category_item.setFlags(category_item.flags() | editable)
+                children = []
+
+                if isinstance(sub_rules, dict): # Nested categories
+                    for sub_key, extensions in sub_rules.items():
+                        if sub_key == "__extensions__": # Our special key for flat extensions
+                            children.extend(QTreeWidgetItem([ext]) for ext in extensions)
+                        else: # A true sub-category
+                            sub_item = QTreeWidgetItem([sub_key])
+                            sub_item.setFlags(sub_item.flags() | editable)
+                            sub_item.addChildren([QTreeWidgetItem([ext]) for ext in extensions])
+                            children.append(sub_item)
+                elif isinstance(sub_rules, list): # Purely flat categories
+                    children.extend(QTreeWidgetItem([ext]) for ext in sub_rules)
+
+                category_item.addChildren(children)
+                category_items.append(category_item)
+            
+            self.rules_tree.addTopLevelItems(category_items)
+            self.rules_tree.expandAll()
+        finally:
+            self.rules_tree.blockSignals(False)
+            self.rules_tree.setUpdatesEnabled(True)
 
     def _create_ignore_list_section(self) -> QGroupBox:
         box = QGroupBox("Ignored Files & Folders")
         layout = QGridLayout(box)
         self.ignore_list_widget = QListWidget()
+        self._ignore_set = set()  # Mirrors the list's texts for duplicate checks
         self.new_ignore_item_edit = QLineEdit()
         self.new_ignore_item_edit.setPlaceholderText("Enter item to ignore (e.g., 'myfile.txt' or '.tmp')")
         add_button = QPushButton("Add")
@@ -300,12 +364,14 @@ class SettingsPage(QWidget):
         
     def _add_ignore_item(self):
         item_text = self.new_ignore_item_edit.text().strip()
-        if item_text and not self.ignore_list_widget.findItems(item_text, Qt.MatchFlag.MatchExactly):
+        if item_text and item_text not in self._ignore_set:
+            self._ignore_set.add(item_text)
             self.ignore_list_widget.addItem(QListWidgetItem(item_text))
             self.new_ignore_item_edit.clear()
             
     def _remove_ignore_item(self):
         for item in self.ignore_list_widget.selectedItems():
+            self._ignore_set.discard(item.text())
             self.ignore_list_widget.takeItem(self.ignore_list_widget.row(item))
 
     # --- NEW, ROBUST SAVING LOGIC ---
@@ -322,28 +388,26 @@ class SettingsPage(QWidget):
             strategy = "ignore"
         self.current_config["folder_handling_strategy"] = strategy
         
+        # Each item's children and text are read from Qt once
+        def children_of(item):
+            return [item.child(k) for k in range(item.childCount())]
+
         new_rules = {}
-        for i in range(self.rules_tree.topLevelItemCount()):
-            category_item = self.rules_tree.topLevelItem(i)
+        tree = self.rules_tree
+        for category_item in (tree.topLevelItem(i) for i in range(tree.topLevelItemCount())):
             category_name = category_item.text(0)
-            
-            # This is the new, robust saving algorithm
-            has_sub_categories = False
-            flat_extensions = []
+            # If a child has its own children, it's a sub-category; otherwise
+            # it's a flat extension
             nested_rules = {}
-            
-            for j in range(category_item.childCount()):
-                child_item = category_item.child(j)
-                # If a child has its own children, it's a sub-category
-                if child_item.childCount() > 0:
-                    has_sub_categories = True
-                    sub_name = child_item.text(0)
-                    extensions = [child_item.child(k).text(0) for k in range(child_item.childCount())]
-                    nested_rules[sub_name] = extensions
-                else: # It's a flat extension
+            flat_extensions = []
+            for child_item in children_of(category_item):
+                grandchildren = children_of(child_item)
+                if grandchildren:
+                    nested_rules[child_item.text(0)] = [ext.text(0) for ext in grandchildren]
+                else:
                     flat_extensions.append(child_item.text(0))
             
-            if has_sub_categories:
+            if nested_rules:
                 # If there are any sub-categories, we must use the nested format.
                 # Store any flat extensions under the special key.
                 if flat_extensions:
@@ -359,8 +423,11 @@ class SettingsPage(QWidget):
         new_ignore_list = [self.ignore_list_widget.item(i).text() for i in range(self.ignore_list_widget.count())]
         self.current_config["ignore_list"] = new_ignore_list
         
+        from PySide6.QtWidgets import QMessageBox
         try:
             self.config_manager.save_config(self.current_config)
+            # The controls already show what was just written
+            self._config_signature = self.config_manager.get_signature()
             QMessageBox.information(self, "Success", "Settings saved.")
             signals.config_changed.emit()
         except Exception as e:
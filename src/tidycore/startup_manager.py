@@ -8,27 +8,43 @@ if sys.platform == 'win32':
 class StartupManager:
     """Manages adding/removing the application from OS startup."""
 
-    def __init__(self, app_name: str, app_path: str):
+    def __init__(self, app_name: str, app_path: str = None):
         """
         Initializes the manager.
         Args:
             app_name: The name for the startup entry (e.g., "TidyCore").
             app_path: The full path to the executable to run on startup.
+                Worked out by get_application_path() on first use if omitted.
         """
         self.app_name = app_name
-        self.app_path = app_path
+        self._app_path = app_path
         self.is_windows = (sys.platform == 'win32')
+        # Result of the last registry lookup; kept current by enable()/disable()
+        self._enabled_cache = None
         
         if self.is_windows:
             # The registry key for current user startup programs
             self.registry_key = winreg.HKEY_CURRENT_USER
             self.run_key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
+    @property
+    def app_path(self) -> str:
+        """The command registered for startup, resolved the first time it is needed."""
+        if self._app_path is None:
+            self._app_path = get_application_path()
+        return self._app_path
+
     def is_enabled(self) -> bool:
         """Checks if the application is currently set to run on startup."""
         if not self.is_windows:
             return False # Not implemented for other OS yet
 
+        if self._enabled_cache is None:
+            self._enabled_cache = self._query_enabled()
+        return self._enabled_cache
+
+    def _query_enabled(self) -> bool:
+        """Reads the startup entry from the registry."""
         try:
             with winreg.OpenKey(self.registry_key, self.run_key_path, 0, winreg.KEY_READ) as key:
                 # Try to read the value. If it exists, it's enabled.
@@ -41,6 +57,10 @@ class StartupManager:
             # Handle other potential errors gracefully
             return False
 
+    def invalidate(self):
+        """Forgets the cached state, e.g. if the entry may have been changed outside TidyCore."""
+        self._enabled_cache = None
+
     def enable(self):
         """Adds the application to startup."""
         if not self.is_windows:
@@ -52,7 +72,9 @@ class StartupManager:
                 # Set the value: The name is our app name, the data is the path.
                 # The path must be enclosed in quotes if it contains spaces.
                 winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, f'"{self.app_path}"')
+            self._enabled_cache = True
         except Exception as e:
+            self.invalidate()
             print(f"Error enabling startup: {e}")
 
     def disable(self):
@@ -64,10 +86,12 @@ class StartupManager:
             with winreg.OpenKey(self.registry_key, self.run_key_path, 0, winreg.KEY_WRITE) as key:
                 # Simply delete the value with our app's name.
                 winreg.DeleteValue(key, self.app_name)
+            self._enabled_cache = False
         except FileNotFoundError:
             # It's already disabled, no need to do anything.
-            pass
+            self._enabled_cache = False
         except Exception as e:
+            self.invalidate()
             print(f"Error disabling startup: {e}")
 
 # --- NEW, SIMPLER LOGIC FOR APPLICATION_PATH ---
@@ -84,4 +108,5 @@ def get_application_path():
         return f'"{sys.executable}" "{main_script_path}"'
 
 # Create a single instance to be used by the app
-startup_manager = StartupManager(app_name="TidyCore", app_path=get_application_path())
\ No newline at end of file
+# (the startup command is only resolved when startup is enabled)
+startup_manager = StartupManager(app_name="TidyCore")
\ No newline at end of file